@@ -0,0 +1,143 @@
+"""
+Bootstrap confidence intervals for per-player mistake rates.
+
+Attempts are resampled with replacement, and every resample's rates are
+recomputed from the attempt x player matrices of a MistakeMatrix. With
+NumPy a whole batch of resamples is a pair of matrix products; without it
+a (much slower) pure-Python loop gives the same kind of answer.
+"""
+
+import random
+from typing import List, Dict, Any, Optional, Tuple
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from .mistake_matrix import MistakeMatrix
+
+# Resamples per NumPy batch, to keep the weight matrix small
+BATCH_SIZE = 256
+
+
+def bootstrap_rates(matrix: MistakeMatrix, per: str = 'pull', resamples: int = 2000,
+                    confidence: float = 0.95, pulls: Optional[Tuple[int, int]] = None,
+                    boss: Optional[str] = None, cause: Optional[str] = None,
+                    seed: Optional[int] = None) -> List[Dict[str, Any]]:
+    """Per-player mistake rates with bootstrap confidence intervals.
+
+    Returns one dict per player (player, count, exposure, rate, low, high),
+    ranked by the lower bound of the interval, so a player only tops the
+    list if they are worst even on a generous reading of their pulls.
+    """
+    if per not in ('pull', 'minute'):
+        raise ValueError(f"Unknown rate unit: {per} (expected 'pull' or 'minute')")
+    if not 0 < confidence < 1:
+        raise ValueError(f"Confidence must be between 0 and 1, got {confidence}")
+
+    counts, exposure = matrix.per_attempt(per, pulls, boss, cause)
+    tail = (1 - confidence) / 2 * 100
+    if np is not None:
+        totals, exposures, lows, highs = _bootstrap_numpy(counts, exposure, resamples, tail, seed)
+    else:
+        totals, exposures, lows, highs = _bootstrap_python(counts, exposure, len(matrix.players), resamples, tail, seed)
+
+    results = []
+    for player_id, player in enumerate(matrix.players):
+        if not exposures[player_id] or not totals[player_id]:
+            continue
+        results.append({
+            'player': player,
+            'count': int(totals[player_id]),
+            'exposure': float(exposures[player_id]),
+            'rate': float(totals[player_id] / exposures[player_id]),
+            'low': float(lows[player_id]),
+            'high': float(highs[player_id]),
+        })
+
+    results.sort(key=lambda x: (x['low'], x['rate']), reverse=True)
+    return results
+
+
+def _bootstrap_numpy(counts, exposure, resamples: int, tail: float, seed: Optional[int]):
+    """Resample attempts in batches of weight vectors (B x attempts)."""
+    rng = np.random.default_rng(seed)
+    num_attempts, num_players = counts.shape
+    totals, exposures = counts.sum(axis=0), exposure.sum(axis=0)
+    if num_attempts == 0:
+        return totals, exposures, np.zeros(num_players), np.zeros(num_players)
+
+    rates = np.empty((resamples, num_players))
+    for start in range(0, resamples, BATCH_SIZE):
+        size = min(BATCH_SIZE, resamples - start)
+        # How many times each attempt is drawn in each resample
+        draws = rng.integers(0, num_attempts, size=(size, num_attempts), dtype=np.int64)
+        draws += np.arange(size, dtype=np.int64)[:, None] * num_attempts
+        weights = np.bincount(draws.ravel(), minlength=size * num_attempts)
+        weights = weights.reshape(size, num_attempts).astype(float)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            rates[start:start + size] = (weights @ counts) / (weights @ exposure)
+
+    # Resamples where a player attended nothing don't say anything about them
+    rates[~np.isfinite(rates)] = np.nan
+    with np.errstate(all='ignore'):
+        lows, highs = np.nanpercentile(rates, [tail, 100 - tail], axis=0)
+    return totals, exposures, np.nan_to_num(lows), np.nan_to_num(highs)
+
+
+def _bootstrap_python(counts, exposure, num_players: int, resamples: int, tail: float, seed: Optional[int]):
+    """Resample attempts one draw at a time."""
+    rng = random.Random(seed)
+    num_attempts = len(counts)
+    totals = [0] * num_players
+    exposures = [0.0] * num_players
+    for attempt_counts, attempt_exposure in zip(counts, exposure):
+        for player, count in attempt_counts.items():
+            totals[player] += count
+        for player, value in attempt_exposure.items():
+            exposures[player] += value
+
+    samples = [[] for _ in range(num_players)]
+    for _ in range(resamples if num_attempts else 0):
+        sample_totals = [0] * num_players
+        sample_exposures = [0.0] * num_players
+        for attempt in rng.choices(range(num_attempts), k=num_attempts):
+            for player, count in counts[attempt].items():
+                sample_totals[player] += count
+            for player, value in exposure[attempt].items():
+                sample_exposures[player] += value
+        for player in range(num_players):
+            if sample_exposures[player]:
+                samples[player].append(sample_totals[player] / sample_exposures[player])
+
+    lows, highs = [], []
+    for values in samples:
+        values.sort()
+        lows.append(_percentile(values, tail))
+        highs.append(_percentile(values, 100 - tail))
+    return totals, exposures, lows, highs
+
+
+def _percentile(values: List[float], q: float) -> float:
+    """Linear-interpolated percentile of sorted values (NumPy's default)."""
+    if not values:
+        return 0.0
+    position = (len(values) - 1) * q / 100
+    low = int(position)
+    high = min(low + 1, len(values) - 1)
+    return values[low] + (values[high] - values[low]) * (position - low)
+
+
+def format_bootstrap_rates(results: List[Dict[str, Any]], per: str = 'pull',
+                           confidence: float = 0.95, resamples: int = 2000) -> str:
+    """Format bootstrap rankings for output."""
+    output = [f"Mistake Rates with {confidence:.0%} Confidence (per {per}, {resamples} resamples):\n"]
+    unit = "pulls" if per == 'pull' else "min"
+    for i, row in enumerate(results, 1):
+        output.append(
+            f"{i}. {row['player']}: {row['rate']:.3f} per {per} "
+            f"({confidence:.0%} CI {row['low']:.3f} - {row['high']:.3f}, "
+            f"{row['count']} mistakes over {row['exposure']:.0f} {unit})"
+        )
+    return "\n".join(output)
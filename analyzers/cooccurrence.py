@@ -0,0 +1,211 @@
+"""
+Mistake co-occurrence - which mistakes, and which players' deaths, tend to
+land in the same pull, with lift against what chance alone would give.
+
+Builds attempt x mistake and attempt x player incidence matrices so every
+pair count comes out of one X^T X product (sparse with SciPy, dense with
+just NumPy), with a per-attempt pair loop as the pure-Python fallback.
+"""
+
+import heapq
+from collections import Counter
+from itertools import combinations
+from typing import List, Dict, Any, Optional, Tuple
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    from scipy import sparse
+except ImportError:
+    sparse = None
+
+
+class CooccurrenceMatrix:
+    """Attempt x mistake and attempt x player incidence built from parsed attempts.
+
+    A mistake is either a player mistake cause (fatal or not) or one of
+    the boss's non-player mistakes (under-soaked canisters, enrages, ...),
+    and is counted once per attempt however often it happened in it. The
+    player columns only count deaths (events that say "died" or "killed",
+    as in the event export). Lift is
+    count * attempts / (first count * second count): 1.0 means the pair
+    shows up together exactly as often as chance would have it.
+    """
+
+    def __init__(self, attempts: List[Any]):
+        self.num_attempts = len(attempts)
+        self.mistakes: List[str] = []
+        self.is_player: List[bool] = []  # per mistake: player mistake or not
+        self.players: List[str] = []
+        mistake_ids: Dict[Tuple[bool, str], int] = {}
+        player_ids: Dict[str, int] = {}
+
+        # One sorted tuple of column ids per attempt
+        self._mistake_rows: List[Tuple[int, ...]] = []
+        self._player_rows: List[Tuple[int, ...]] = []
+        for attempt in attempts:
+            keys = []
+            players = set()
+            for event in attempt.events:
+                player, cause = attempt.boss.extract_player_death(event)
+                if not (player and cause):
+                    continue
+                keys.append((True, cause))
+                if "died" in event or "killed" in event:
+                    if player not in player_ids:
+                        player_ids[player] = len(self.players)
+                        self.players.append(player)
+                    players.add(player_ids[player])
+            for mistake, count in attempt.boss.analyze_non_player_mistakes([attempt]).items():
+                if count:
+                    keys.append((False, mistake))
+
+            columns = set()
+            for key in keys:
+                if key not in mistake_ids:
+                    mistake_ids[key] = len(self.mistakes)
+                    self.is_player.append(key[0])
+                    self.mistakes.append(key[1])
+                columns.add(mistake_ids[key])
+            self._mistake_rows.append(tuple(sorted(columns)))
+            self._player_rows.append(tuple(sorted(players)))
+
+    def mistake_pairs(self, top: int = 10, min_count: int = 3, by: str = 'lift') -> List[Dict[str, Any]]:
+        """Mistakes that share pulls, strongest first.
+
+        Pairs of two non-player mistakes are left out (a canister breakdown
+        always comes with the overall under-soak), so every pair says
+        something about a player.
+        """
+        return self._top_pairs(self._mistake_rows, self.mistakes, top, min_count, by, self.is_player)
+
+    def player_pairs(self, top: int = 10, min_count: int = 3, by: str = 'lift') -> List[Dict[str, Any]]:
+        """Players who die in the same pulls, strongest first."""
+        return self._top_pairs(self._player_rows, self.players, top, min_count, by)
+
+    def _top_pairs(self, rows: List[Tuple[int, ...]], names: List[str], top: int,
+                   min_count: int, by: str, required: Optional[List[bool]] = None) -> List[Dict[str, Any]]:
+        """Rank pairs of columns seen together more often than chance (lift above 1).
+
+        With required, one side of each pair must be flagged.
+        """
+        if by not in ('lift', 'count'):
+            raise ValueError(f"Unknown ranking: {by} (expected 'lift' or 'count')")
+        if top <= 0 or not names:
+            return []
+
+        if np is not None:
+            first, second, counts, totals = _pair_counts_numpy(rows, len(names))
+            keep = counts >= min_count
+            if required is not None:
+                flagged = np.array(required, dtype=bool)
+                keep &= flagged[first] | flagged[second]
+            first, second, counts = first[keep], second[keep], counts[keep]
+            lifts = counts * self.num_attempts / (totals[first] * totals[second])
+            keep = lifts > 1
+            first, second, counts, lifts = first[keep], second[keep], counts[keep], lifts[keep]
+            scores = lifts if by == 'lift' else counts
+            if len(scores) > top:
+                # Everything tied with the k-th best stays in, so ties break
+                # the same way as in the fallback
+                threshold = np.partition(scores, len(scores) - top)[len(scores) - top]
+                keep = scores >= threshold
+                first, second, counts, lifts = first[keep], second[keep], counts[keep], lifts[keep]
+            order = np.lexsort((second, first, -counts, -lifts)) if by == 'lift' \
+                else np.lexsort((second, first, -lifts, -counts))
+            pairs = [(int(first[i]), int(second[i]), int(counts[i])) for i in order[:top]]
+            totals = [int(total) for total in totals]
+        else:
+            pair_counts, totals = _pair_counts_python(rows, len(names))
+            candidates = []
+            for (a, b), count in pair_counts.items():
+                if count < min_count or (required is not None and not (required[a] or required[b])):
+                    continue
+                lift = count * self.num_attempts / (totals[a] * totals[b])
+                if lift <= 1:
+                    continue
+                score = (-lift, -count) if by == 'lift' else (-count, -lift)
+                candidates.append((score, a, b, count))
+            pairs = [(a, b, count) for _, a, b, count in heapq.nsmallest(top, candidates)]
+
+        return [
+            {
+                'first': names[a],
+                'second': names[b],
+                'count': count,
+                'first_count': totals[a],
+                'second_count': totals[b],
+                'lift': count * self.num_attempts / (totals[a] * totals[b]),
+            }
+            for a, b, count in pairs
+        ]
+
+
+def _incidence(rows: List[Tuple[int, ...]], num_columns: int):
+    """Binary attempt x column matrix, sparse when SciPy is around."""
+    row_ids = np.repeat(np.arange(len(rows), dtype=np.intp), [len(row) for row in rows])
+    column_ids = np.fromiter((column for row in rows for column in row), dtype=np.intp, count=len(row_ids))
+    if sparse is not None:
+        return sparse.csr_matrix(
+            (np.ones(len(row_ids)), (row_ids, column_ids)), shape=(len(rows), num_columns)
+        )
+    matrix = np.zeros((len(rows), num_columns))
+    matrix[row_ids, column_ids] = 1.0
+    return matrix
+
+
+def _pair_counts_numpy(rows: List[Tuple[int, ...]], num_columns: int):
+    """Upper-triangle pair counts (first, second, count) and per-column totals."""
+    matrix = _incidence(rows, num_columns)
+    products = matrix.T @ matrix
+    if sparse is not None:
+        totals = products.diagonal()
+        upper = sparse.triu(products, k=1).tocoo()
+        first, second, counts = upper.row, upper.col, upper.data
+    else:
+        totals = np.diagonal(products).copy()
+        first, second = np.nonzero(np.triu(products, k=1))
+        counts = products[first, second]
+    return first.astype(np.intp), second.astype(np.intp), counts.astype(np.int64), totals
+
+
+def _pair_counts_python(rows: List[Tuple[int, ...]], num_columns: int):
+    """The same counts from every pair within each attempt."""
+    pair_counts = Counter()
+    totals = [0] * num_columns
+    for row in rows:
+        for column in row:
+            totals[column] += 1
+        pair_counts.update(combinations(row, 2))
+    return pair_counts, totals
+
+
+def format_pairs(pairs: List[Dict[str, Any]], title: str, num_attempts: int) -> str:
+    """Format co-occurring pairs for output."""
+    output = [f"{title}:\n"]
+    if not pairs:
+        output.append("No pairs showed up together often enough.")
+        return "\n".join(output)
+
+    for i, pair in enumerate(pairs, 1):
+        output.append(
+            f"{i}. {pair['first']} + {pair['second']}: {pair['count']} of {num_attempts} pulls, "
+            f"lift {pair['lift']:.2f}"
+        )
+        output.append(
+            f"   {pair['count'] / pair['first_count']:.0%} of pulls with {pair['first']} also had {pair['second']}, "
+            f"{pair['count'] / pair['second_count']:.0%} the other way"
+        )
+    return "\n".join(output)
+
+
+def format_cooccurrence(matrix: CooccurrenceMatrix, top: int = 10, min_count: int = 3,
+                        by: str = 'lift') -> str:
+    """Format the mistake and player pair tables for output."""
+    return "\n\n".join([
+        format_pairs(matrix.mistake_pairs(top, min_count, by), "Mistakes In The Same Pull", matrix.num_attempts),
+        format_pairs(matrix.player_pairs(top, min_count, by), "Players Dying Together", matrix.num_attempts),
+    ])
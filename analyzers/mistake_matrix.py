@@ -0,0 +1,252 @@
+"""
+Mistake matrix - sparse attempt x player x cause counts, normalized into
+per-pull and per-minute-of-fight rates.
+
+Uses NumPy (and SciPy's sparse matrices when installed) for the heavy
+lifting, with a plain dict-of-arrays fallback so nothing is required.
+"""
+
+from array import array
+from collections import defaultdict
+from typing import List, Dict, Any, Optional, Tuple
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    from scipy import sparse
+except ImportError:
+    sparse = None
+
+
+class MistakeMatrix:
+    """Attempt x (player, cause) count matrix built from parsed attempts.
+
+    Rows follow the order of the attempts passed in, so pull numbers match
+    the renumbered pulls in the cleaned output. Column p * len(causes) + c
+    holds the count for players[p] and causes[c].
+
+    A player is counted as attending every pull of a night (calendar date
+    of the attempt) in which they show up at all, since the bot only lists
+    players who made a mistake.
+    """
+
+    def __init__(self, attempts: List[Any]):
+        self.players: List[str] = []
+        self.causes: List[str] = []
+        self.bosses: List[str] = []
+        self.night_dates: List[Any] = []
+        player_ids: Dict[str, int] = {}
+        cause_ids: Dict[str, int] = {}
+        night_ids: Dict[Any, int] = {}
+
+        rows, players, causes, nights, durations = [], [], [], [], []
+        seen = set()  # (night, player) pairs
+        for row, attempt in enumerate(attempts):
+            night = attempt.datetime.date() if attempt.datetime else None
+            if night not in night_ids:
+                night_ids[night] = len(self.night_dates)
+                self.night_dates.append(night)
+            night_id = night_ids[night]
+            nights.append(night_id)
+            durations.append(attempt.duration)
+            self.bosses.append(attempt.boss.name)
+
+            for event in attempt.events:
+                player, cause = attempt.boss.extract_player_death(event)
+                if not (player and cause):
+                    continue
+                if player not in player_ids:
+                    player_ids[player] = len(self.players)
+                    self.players.append(player)
+                if cause not in cause_ids:
+                    cause_ids[cause] = len(self.causes)
+                    self.causes.append(cause)
+                rows.append(row)
+                players.append(player_ids[player])
+                causes.append(cause_ids[cause])
+                seen.add((night_id, player_ids[player]))
+
+        self.num_attempts = len(attempts)
+        num_causes = len(self.causes)
+        shape = (self.num_attempts, len(self.players) * num_causes)
+
+        if np is not None:
+            self.nights = np.array(nights, dtype=np.intp)
+            self.durations = np.array(durations, dtype=float)
+            self.boss_names = np.array(self.bosses, dtype=object)
+            self.presence = np.zeros((len(self.night_dates), len(self.players)), dtype=float)
+            if seen:
+                seen_nights, seen_players = zip(*seen)
+                self.presence[list(seen_nights), list(seen_players)] = 1.0
+            self._rows = np.array(rows, dtype=np.intp)
+            self._cols = np.array(players, dtype=np.intp) * num_causes + np.array(causes, dtype=np.intp)
+            if sparse is not None:
+                self.matrix = sparse.csr_matrix(
+                    (np.ones(len(rows)), (self._rows, self._cols)), shape=shape
+                )
+            else:
+                self.matrix = None
+        else:
+            # Fallback: one array of attempt rows per (player, cause) column,
+            # repeated once per occurrence
+            self.nights = nights
+            self.durations = durations
+            self.presence = seen  # (night, player) pairs
+            self.matrix = None
+            self._columns: Dict[int, array] = defaultdict(lambda: array('l'))
+            for row, player, cause in zip(rows, players, causes):
+                self._columns[player * num_causes + cause].append(row)
+
+    def _select(self, pulls: Optional[Tuple[int, int]] = None, boss: Optional[str] = None):
+        """Rows inside an inclusive pull range and/or for one boss."""
+        low, high = pulls if pulls else (1, self.num_attempts)
+        if np is not None:
+            mask = np.zeros(self.num_attempts, dtype=bool)
+            mask[max(low, 1) - 1:max(high, 0)] = True
+            if boss:
+                mask &= self.boss_names == boss
+            return mask
+        return {
+            row for row in range(max(low, 1) - 1, min(high, self.num_attempts))
+            if not boss or self.bosses[row] == boss
+        }
+
+    def counts(self, pulls: Optional[Tuple[int, int]] = None, boss: Optional[str] = None):
+        """Player x cause totals for the selected attempts."""
+        rows = self._select(pulls, boss)
+        shape = (len(self.players), len(self.causes))
+        if np is not None:
+            if self.matrix is not None:
+                totals = self.matrix.T @ rows.astype(float)
+            else:
+                keep = rows[self._rows]
+                totals = np.bincount(self._cols[keep], minlength=shape[0] * shape[1]).astype(float)
+            return totals.reshape(shape)
+
+        totals = defaultdict(int)
+        for column, column_rows in self._columns.items():
+            count = sum(1 for row in column_rows if row in rows)
+            if count:
+                totals[divmod(column, shape[1])] = count
+        return totals
+
+    def exposure(self, pulls: Optional[Tuple[int, int]] = None, boss: Optional[str] = None):
+        """Pulls attended and minutes of fight time per player."""
+        rows = self._select(pulls, boss)
+        if np is not None:
+            num_nights = len(self.night_dates)
+            pulls_per_night = np.bincount(self.nights[rows], minlength=num_nights)
+            seconds_per_night = np.bincount(self.nights[rows], weights=self.durations[rows], minlength=num_nights)
+            return pulls_per_night @ self.presence, (seconds_per_night @ self.presence) / 60.0
+
+        pulls_per_night = defaultdict(int)
+        seconds_per_night = defaultdict(int)
+        for row in rows:
+            pulls_per_night[self.nights[row]] += 1
+            seconds_per_night[self.nights[row]] += self.durations[row]
+        attended = [0] * len(self.players)
+        seconds = [0] * len(self.players)
+        for night, player in self.presence:
+            attended[player] += pulls_per_night[night]
+            seconds[player] += seconds_per_night[night]
+        # Divide once at the end, like the NumPy path
+        return attended, [total / 60.0 for total in seconds]
+
+    def per_attempt(self, per: str = 'pull', pulls: Optional[Tuple[int, int]] = None,
+                    boss: Optional[str] = None, cause: Optional[str] = None):
+        """Attempt x player mistake counts and exposure for the selected attempts.
+
+        Exposure is 1 (or the fight minutes, for per='minute') wherever the
+        player attended the attempt. With NumPy both are dense arrays;
+        otherwise they are lists of {player index: value} dicts, one per
+        attempt.
+        """
+        rows = self._select(pulls, boss)
+        num_players, num_causes = len(self.players), len(self.causes)
+        cause_id = self.causes.index(cause) if cause in self.causes else None
+        if cause is not None and cause_id is None:
+            raise ValueError(f"Unknown cause: {cause}")
+
+        if np is not None:
+            keep = rows[self._rows]
+            if cause_id is not None:
+                keep &= self._cols % num_causes == cause_id
+            flat = self._rows[keep] * num_players + self._cols[keep] // num_causes
+            counts = np.bincount(flat, minlength=self.num_attempts * num_players).astype(float)
+            counts = counts.reshape(self.num_attempts, num_players)[rows]
+            exposure = self.presence[self.nights[rows]]
+            if per == 'minute':
+                exposure = exposure * (self.durations[rows] / 60.0)[:, None]
+            return counts, exposure
+
+        present = defaultdict(list)
+        for night, player in self.presence:
+            present[night].append(player)
+        selected = sorted(rows)
+        positions = {row: i for i, row in enumerate(selected)}
+        counts = [defaultdict(int) for _ in selected]
+        for column, column_rows in self._columns.items():
+            player, column_cause = divmod(column, num_causes)
+            if cause_id is not None and column_cause != cause_id:
+                continue
+            for row in column_rows:
+                if row in positions:
+                    counts[positions[row]][player] += 1
+        exposure = []
+        for row in selected:
+            value = 1 if per == 'pull' else self.durations[row] / 60.0
+            exposure.append({player: value for player in present[self.nights[row]]})
+        return counts, exposure
+
+    def rates(self, per: str = 'pull', pulls: Optional[Tuple[int, int]] = None,
+              boss: Optional[str] = None) -> Dict[str, Dict[str, float]]:
+        """Mistakes per pull attended or per minute of fight time.
+
+        Returns the same player -> cause -> value shape as
+        analyze_player_stats(), leaving out zero rates.
+        """
+        if per not in ('pull', 'minute'):
+            raise ValueError(f"Unknown rate unit: {per} (expected 'pull' or 'minute')")
+
+        counts = self.counts(pulls, boss)
+        attended, minutes = self.exposure(pulls, boss)
+        denominators = attended if per == 'pull' else minutes
+
+        rates = {}
+        if np is not None:
+            denominators = np.asarray(denominators, dtype=float)
+            with np.errstate(divide='ignore', invalid='ignore'):
+                values = np.where(denominators[:, None] > 0, counts / denominators[:, None], 0.0)
+            for player, cause in zip(*np.nonzero(values)):
+                rates.setdefault(self.players[player], {})[self.causes[cause]] = float(values[player, cause])
+            return rates
+
+        # Player then cause order, like np.nonzero(), so ties sort the same
+        for (player, cause), count in sorted(counts.items()):
+            if denominators[player] > 0:
+                rates.setdefault(self.players[player], {})[self.causes[cause]] = count / denominators[player]
+        return rates
+
+
+def format_player_rates(matrix: MistakeMatrix, per: str = 'pull',
+                        pulls: Optional[Tuple[int, int]] = None, boss: Optional[str] = None) -> str:
+    """Format per-pull or per-minute mistake rates for output."""
+    rates = matrix.rates(per, pulls, boss)
+    attended, minutes = matrix.exposure(pulls, boss)
+    output = [f"Player Mistake Rates (per {per}):\n"]
+
+    sorted_players = sorted(rates.items(), key=lambda x: sum(x[1].values()), reverse=True)
+    for player, player_rates in sorted_players:
+        index = matrix.players.index(player)
+        rate_list = [f"{cause} {rate:.3f}" for cause, rate in sorted(player_rates.items(), key=lambda x: x[1], reverse=True)]
+        output.append(
+            f"{player} ({sum(player_rates.values()):.3f} per {per}, "
+            f"{int(attended[index])} pulls, {float(minutes[index]):.1f} min)"
+        )
+        output.append("  " + ", ".join(rate_list))
+        output.append("")
+
+    return "\n".join(output)
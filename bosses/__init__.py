@@ -2,24 +2,61 @@
 Boss detection and loading.
 """
 
+import re
+from typing import Iterable
+
 from .base import Boss
 from .nexus_king import NexusKing
 from .archived.mugzee import MugZee
 from .archived.stixbunkjunker import StixBunkjunker
 from .archived.gallywix import Gallywix
 
+# Name patterns for each boss (newest first - earlier entries win)
+BOSS_PATTERNS = [
+    (('nexus-king',), NexusKing),
+    (("mug'zee", 'mugzee'), MugZee),
+    (('stix bunkjunker',), StixBunkjunker),
+    (('gallywix',), Gallywix),
+]
+
+
+def available_bosses() -> str:
+    """Boss names for error messages, in the form get_boss() accepts."""
+    return ", ".join(patterns[-1].replace(' ', '-') for patterns, _ in BOSS_PATTERNS)
+
+
+def unknown_boss_error() -> ValueError:
+    """The error for content that doesn't name any known boss."""
+    return ValueError(f"Unknown boss type in content. Available bosses: {available_bosses()}")
+
+
+def detect_boss_from_lines(lines: Iterable[str]) -> Boss:
+    """Figure out which boss we're dealing with, reading only as far as needed."""
+    best = None
+    for line in lines:
+        line_lower = line.lower()
+        for rank, (patterns, boss_class) in enumerate(BOSS_PATTERNS[:best]):
+            if any(pattern in line_lower for pattern in patterns):
+                best = rank
+                break
+        # Nothing can beat the newest boss
+        if best == 0:
+            break
+
+    if best is None:
+        raise unknown_boss_error()
+    return BOSS_PATTERNS[best][1]()
+
+
+def get_boss(name: str) -> Boss:
+    """Look up a boss by name, ignoring case and punctuation ("Mug'Zee", "mugzee")."""
+    key = re.sub(r'[^a-z]', '', name.lower())
+    for patterns, boss_class in BOSS_PATTERNS:
+        if any(re.sub(r'[^a-z]', '', pattern) == key for pattern in patterns):
+            return boss_class()
+    raise ValueError(f"Unknown boss: {name}. Available bosses: {available_bosses()}")
+
+
 def detect_boss_from_content(content: str) -> Boss:
     """Figure out which boss we're dealing with."""
-    content_lower = content.lower()
-    
-    # Check for boss patterns (newest first)
-    if 'nexus-king' in content_lower or 'Nexus-King' in content:
-        return NexusKing()
-    elif "mug'zee" in content_lower or 'mugzee' in content_lower:
-        return MugZee()
-    elif 'stix bunkjunker' in content_lower:
-        return StixBunkjunker()
-    elif 'gallywix' in content_lower:
-        return Gallywix()
-    else:
-        raise ValueError(f"Unknown boss type in content. Available bosses: nexus-king, mugzee, stix-bunkjunker, gallywix")
+    return detect_boss_from_lines([content])
@@ -2,39 +2,25 @@
 WoW raid log parser - processes Discord bot output into structured data.
 """
 
-import re
+import argparse
+import sys
+from collections import defaultdict, deque
+from contextlib import contextmanager
 from datetime import datetime
-from collections import defaultdict
-from typing import List, Any, Dict
+from functools import cached_property
+from typing import List, Any, Dict, Optional, Tuple
 
-from bosses import detect_boss_from_content
-from parsers.timestamp import is_timestamp, parse_timestamp
+from bosses import detect_boss_from_lines, get_boss
+from parsers.arguments import at_least, parse_pull_range, parse_date
+from parsers.attempts import Attempt, clean_line, iter_attempts, parse_attempts
+from parsers.parallel import parse_attempts_parallel
+from parsers.source import open_lines, is_plain_text
+from parsers.tail import detect_tail_boss, read_last_attempts
 from analyzers.player_stats import analyze_player_stats, format_player_stats
 from analyzers.mistakes import format_non_player_mistakes
 from exporters.csv import export_to_csv
-
-
-class Attempt:
-    """Represents a single boss attempt."""
-    
-    def __init__(self, header: str, events: List[str], timestamp: str, boss):
-        self.header = header
-        self.events = events
-        self.timestamp = timestamp
-        self.datetime = parse_timestamp(timestamp)
-        self.boss = boss
-        # Extract duration from header
-        duration_match = re.search(r"\((\d+):(\d+)\)", header)
-        if duration_match:
-            minutes, seconds = map(int, duration_match.groups())
-            self.duration = minutes * 60 + seconds
-        else:
-            self.duration = 0
-
-    def format_attempt(self, attempt_number: int) -> List[str]:
-        """Format the attempt with the new number."""
-        duration = self.header.split('(')[1]
-        return [self.boss.format_attempt(attempt_number, self.header, duration)] + self.events + [self.timestamp]
+from exporters.events import export_events, export_event_summary
+from indexes.offsets import OffsetIndex, index_path, load_current_index
 
 
 def get_worst_offenders(stats: Dict[str, Dict[str, int]]) -> str:
@@ -72,11 +58,202 @@ def get_worst_offenders(stats: Dict[str, Dict[str, int]]) -> str:
     return "\n".join(output)
 
 
-def clean_data(input_file: str, output_file: str, csv_file: str, boss) -> None:
-    """Parse Discord bot output and generate clean raid data."""
+class RaidReport:
+    """Every stage of the report, computed only when something asks for it.
+
+    Nothing is read until a property is used, and each stage is cached, so
+    asking for just the worst offenders never formats the cleaned output,
+    and the text report, CSV and verification share one parse.
+    """
+
+    def __init__(self, input_file: str, boss=None, workers: int = 1, last: Optional[int] = None,
+                 write_index: bool = False, pulls: Optional[Tuple[int, int]] = None,
+                 since: Optional[datetime] = None, until: Optional[datetime] = None):
+        self.input_file = input_file
+        self.workers = workers
+        # Only the last N attempts in the file, numbered by their bot pull numbers
+        self.last = last
+        # Write the <input>.idx offset index while parsing
+        self.write_index = write_index
+        # Only these cleaned pulls / this time range, read through the offset index
+        self.pulls = pulls
+        self.since = since
+        self.until = until
+        self.selecting = bool(pulls or since or until)
+        if boss is not None:
+            self.boss = boss
+
+    @cached_property
+    def lines(self) -> List[str]:
+        """Raw input lines (only read for verification)."""
+        with open_lines(self.input_file) as source:
+            return list(source)
+
+    @cached_property
+    def seekable(self) -> bool:
+        return is_plain_text(self.input_file)
+
+    @cached_property
+    def parallel(self) -> bool:
+        return self.workers != 1 and not self.last and not self.write_index and self.seekable
+
+    @cached_property
+    def _stored_index(self) -> Optional[OffsetIndex]:
+        return None if self.write_index else load_current_index(self.input_file)
+
+    @cached_property
+    def offset_index(self) -> OffsetIndex:
+        """The sidecar index, rebuilt (and rewritten) if it's missing or stale."""
+        index = self._stored_index
+        if index is None or index.boss != self.boss.name:
+            index = self._build_index()
+        return index
+
+    def _build_index(self) -> OffsetIndex:
+        index, _ = OffsetIndex.build(self.input_file, self.boss)
+        index.save(index_path(self.input_file))
+        return index
+
+    @cached_property
+    def selection(self) -> Tuple[int, int]:
+        """Range of index entries picked by the pulls and time range."""
+        return self.offset_index.select(self.pulls, self.since, self.until)
+
+    @cached_property
+    def boss(self):
+        if self.selecting and self._stored_index:
+            return get_boss(self._stored_index.boss)
+        if self.last and self.seekable:
+            return detect_tail_boss(self.input_file)
+        # Stream it - most outputs never need the whole input in memory
+        with open_lines(self.input_file) as lines:
+            return detect_boss_from_lines(lines)
+
+    @cached_property
+    def _parsed(self):
+        if self.selecting:
+            try:
+                attempts = self.offset_index.read_attempts(self.input_file, *self.selection, self.boss)
+            except ValueError:
+                # Edited in place since it was indexed - reindex and try again
+                self.offset_index = self._build_index()
+                del self.selection
+                attempts = self.offset_index.read_attempts(self.input_file, *self.selection, self.boss)
+            return attempts, analyze_player_stats(attempts)
+        if self.write_index:
+            index, attempts = OffsetIndex.build(self.input_file, self.boss)
+            index.save(index_path(self.input_file))
+            return attempts, analyze_player_stats(attempts)
+        if self.last:
+            if self.seekable:
+                attempts = read_last_attempts(self.input_file, self.boss, self.last)
+            else:
+                # Compressed or exported input can't be read backwards
+                with open_lines(self.input_file) as lines:
+                    attempts = list(deque(
+                        (attempt for attempt in iter_attempts(lines, self.boss) if attempt.events),
+                        maxlen=self.last,
+                    ))
+            attempts.sort(key=lambda x: x.datetime)
+            return attempts, analyze_player_stats(attempts)
+        if self.parallel:
+            return parse_attempts_parallel(self.input_file, self.boss, self.workers)
+        with open_lines(self.input_file) as lines:
+            attempts = parse_attempts(lines, self.boss)
+        return attempts, analyze_player_stats(attempts)
+
+    @property
+    def attempts(self) -> List[Attempt]:
+        return self._parsed[0]
+
+    @property
+    def player_stats(self) -> Dict[str, Dict[str, int]]:
+        return self._parsed[1]
+
+    @cached_property
+    def output_lines(self) -> List[str]:
+        """Cleaned attempts with renumbered pulls."""
+        output_lines = []
+        first = self.selection[0] + 1 if self.selecting else 1
+        for i, attempt in enumerate(self.attempts, first):
+            output_lines.extend(attempt.format_attempt(attempt.pull_number if self.last else i))
+            output_lines.append("")  # Blank line between attempts
+        return output_lines
+
+    @cached_property
+    def stats_output(self) -> str:
+        return format_player_stats(self.player_stats)
+
+    @cached_property
+    def worst_offenders(self) -> str:
+        # Show who's making the most mistakes
+        return get_worst_offenders(self.player_stats)
+
+    @cached_property
+    def mistakes_output(self) -> str:
+        # Check for non-player mistakes (boss enrage, etc.)
+        return format_non_player_mistakes(self.boss.analyze_non_player_mistakes(self.attempts))
+
+    @cached_property
+    def mistake_matrix(self):
+        # NumPy/SciPy are slow to import, so only load them when asked for
+        from analyzers.mistake_matrix import MistakeMatrix
+        return MistakeMatrix(self.attempts)
+
+    def cause_rates_output(self, per: str = 'pull') -> str:
+        """Each player's rate for every cause, per pull attended or per minute."""
+        from analyzers.mistake_matrix import format_player_rates
+        return format_player_rates(self.mistake_matrix, per)
+
+    def rates_output(self, per: str = 'pull', resamples: int = 2000) -> str:
+        """Per-player rates with bootstrap confidence intervals."""
+        from analyzers.bootstrap import bootstrap_rates, format_bootstrap_rates
+        results = bootstrap_rates(self.mistake_matrix, per, resamples)
+        return format_bootstrap_rates(results, per, resamples=resamples)
+
+    def pairs_output(self, top: int = 10) -> str:
+        """Mistakes and players that show up in the same pulls."""
+        from analyzers.cooccurrence import CooccurrenceMatrix, format_cooccurrence
+        return format_cooccurrence(CooccurrenceMatrix(self.attempts), top)
+
+    def write_text(self, output_file: str) -> None:
+        """Write the cleaned attempts followed by the stats sections."""
+        with open(output_file, 'w', encoding='utf-8') as f:
+            f.writelines(line + "\n" for line in self.output_lines)
+            f.write("\n" + "="*50 + "\n\n")  # Separator
+            f.write(self.stats_output)
+            f.write(self.worst_offenders)
+            f.write(self.mistakes_output)
+
+    def write_verification(self, results_file: str) -> None:
+        """Check the cleaned attempts against the input, without rereading files."""
+        write_verification(self.lines, self.output_lines, results_file)
+
+
+@contextmanager
+def event_attempts(report: RaidReport):
+    """Attempts for the event exports.
+
+    With --last or a pull/time selection they are the attempts already
+    read from the end of the file or through the offset index; otherwise
+    they stream from the raw input rather than the sorted attempts.
+    """
+    if report.last or report.selecting:
+        yield report.attempts
+        return
+    with open_lines(report.input_file) as lines:
+        yield iter_attempts(lines, report.boss)
+
+
+def clean_data(input_file: str, output_file: str, csv_file: str, boss, workers: int = 1) -> None:
+    """Parse Discord bot output and generate clean raid data.
+
+    With workers > 1 (or None for one per CPU) the input is split at attempt
+    headers and parsed in a process pool; the results are identical.
+    """
+    report = RaidReport(input_file, boss, workers)
     try:
-        with open(input_file, 'r', encoding='utf-8') as f:
-            lines = f.readlines()
+        report.attempts
     except FileNotFoundError:
         print(f"Error: Could not find {input_file}")
         return
@@ -84,103 +261,16 @@ def clean_data(input_file: str, output_file: str, csv_file: str, boss) -> None:
         print(f"Error reading {input_file}: {e}")
         return
     
-    attempts = []
-    current_header = None
-    current_events = []
-    current_timestamp = None
-    current_pull_number = None
-    
-    for line in lines:
-        line = line.strip()
-        if not line:
-            continue
-        # Skip Discord bot warnings
-        if ":warning: Experimental :warning:" in line:
-            continue
-        
-        # Strip emojis but keep the actual content
-        cleaned_line = line.strip()
-        
-        # Remove Discord emoji patterns like :NexusKing_Spirits: :Monk~3:
-        # This is a bit hacky but works for the bot's output format
-        cleaned_line = re.sub(r':[^:]+:\s*:[^:]+:\s*', '', cleaned_line)
-        
-        # Fallback for stubborn emoji patterns
-        if ':NexusKing_' in cleaned_line or ':Shaman~' in cleaned_line or ':Warlock~' in cleaned_line:
-            cleaned_line = re.sub(r':[^:]+:', '', cleaned_line).strip()
-        
-        if not cleaned_line:
-            continue
-            
-        # Look for boss attempt headers like "Nexus-King #1 (2:33)"
-        if boss.is_attempt_header(cleaned_line):
-            pull_match = re.search(r'#(\d+)', cleaned_line)
-            if pull_match:
-                pull_number = int(pull_match.group(1))
-                # Skip duplicate pull numbers (sometimes the bot sends duplicates)
-                if pull_number == current_pull_number:
-                    continue
-                # Save the previous attempt if we have both header and timestamp
-                if current_header and current_timestamp:
-                    # Clean up "Part X" suffixes from headers
-                    current_header = re.sub(r'\s*-\s*Part\s+\d+', '', current_header)
-                    attempts.append(Attempt(current_header, current_events, current_timestamp, boss))
-                current_header = cleaned_line
-                current_events = []
-                current_timestamp = None  # Reset for new attempt
-                current_pull_number = pull_number
-            continue
-            
-        # Process events for the current attempt
-        if current_header:
-            if is_timestamp(cleaned_line):
-                current_timestamp = cleaned_line
-            elif boss.is_boss_event(cleaned_line):
-                current_events.append("  " + cleaned_line)  # Indent for readability
-    
-    # Don't forget the last attempt
-    if current_header and current_timestamp:
-        current_header = re.sub(r'\s*-\s*Part\s+\d+', '', current_header)
-        attempts.append(Attempt(current_header, current_events, current_timestamp, boss))
-    
-    # Filter out empty attempts (sometimes from other bosses)
-    attempts = [attempt for attempt in attempts if attempt.events]
-    
-    # Sort by timestamp to get chronological order
-    attempts.sort(key=lambda x: x.datetime)
-    
-    # Generate clean output with renumbered attempts
-    output_lines = []
-    for i, attempt in enumerate(attempts, 1):
-        output_lines.extend(attempt.format_attempt(i))
-        output_lines.append("")  # Blank line between attempts
-    
-    # Generate player stats and summaries
-    player_stats = analyze_player_stats(attempts)
-    stats_output = format_player_stats(player_stats)
-    
-    # Check for non-player mistakes (boss enrage, etc.)
-    non_player_mistakes = boss.analyze_non_player_mistakes(attempts)
-    mistakes_output = format_non_player_mistakes(non_player_mistakes)
-    
-    # Show who's making the most mistakes
-    worst_offenders = get_worst_offenders(player_stats)
-    
     # Write everything to the output file
     try:
-        with open(output_file, 'w', encoding='utf-8') as f:
-            f.writelines(line + "\n" for line in output_lines)
-            f.write("\n" + "="*50 + "\n\n")  # Separator
-            f.write(stats_output)
-            f.write(worst_offenders)
-            f.write(mistakes_output)
+        report.write_text(output_file)
     except Exception as e:
         print(f"Error writing to {output_file}: {e}")
         return
     
     # Export to CSV
     try:
-        export_to_csv(attempts, csv_file)
+        export_to_csv(report.attempts, csv_file, report.player_stats)
         print(f"Data has been cleaned and saved to {output_file}")
         print(f"CSV data has been saved to {csv_file}")
         print(f"Detected boss: {boss.name}")
@@ -190,28 +280,23 @@ def clean_data(input_file: str, output_file: str, csv_file: str, boss) -> None:
     
     print("\nVerifying cleaning process...")
     try:
-        verify_cleaning(input_file, output_file)
+        report.write_verification("verification_results.txt")
         print("Verification results have been saved to verification_results.txt")
     except Exception as e:
         print(f"Error during verification: {e}")
 
 
-def verify_cleaning(input_file: str, output_file: str) -> None:
+def verify_cleaning(input_file: str, output_file: str, results_file: str = "verification_results.txt") -> None:
     """Double-check that we didn't lose any important data during cleaning."""
     try:
-        with open(input_file, 'r', encoding='utf-8') as f:
-            input_lines = f.readlines()
+        with open_lines(input_file) as source:
+            input_lines = list(source)
         with open(output_file, 'r', encoding='utf-8') as f:
             output_lines = f.readlines()
     except Exception as e:
         print(f"Error reading files for verification: {e}")
         return
     
-    # Clean up input to match what we actually process
-    input_lines = [line for line in input_lines if ":warning: Experimental :warning:" not in line]
-    input_lines = [re.sub(r':[^:]+:', '', line).strip() for line in input_lines]
-    input_lines = [line for line in input_lines if line]  # Remove empty lines
-    
     # Remove the stats section from output for comparison
     try:
         stats_start = output_lines.index("="*50 + "\n")
@@ -219,17 +304,27 @@ def verify_cleaning(input_file: str, output_file: str) -> None:
     except ValueError:
         # No stats section found, use all lines
         pass
+    
+    write_verification(input_lines, output_lines, results_file)
+
+
+def write_verification(input_lines: List[str], output_lines: List[str], results_file: str) -> None:
+    """Write which cleaned lines (if any) don't appear in the input."""
+    # Clean up input to match what we actually process
+    input_lines = [clean_line(line) for line in input_lines]
+    input_lines = [line for line in input_lines if line]  # Remove empty lines
     output_lines = [line.strip() for line in output_lines if line.strip()]
     
     # Check if any important data got lost
+    input_set = set(input_lines)
     missing_lines = []
     for line in output_lines:
-        if line not in input_lines:
+        if line not in input_set:
             missing_lines.append(line)
     
     # Write verification report
     try:
-        with open("verification_results.txt", 'w', encoding='utf-8') as f:
+        with open(results_file, 'w', encoding='utf-8') as f:
             f.write("Verification Results:\n\n")
             if not missing_lines:
                 f.write("All lines in the cleaned output exist in the original input.\n")
@@ -249,25 +344,159 @@ def verify_cleaning(input_file: str, output_file: str) -> None:
         print(f"Error writing verification results: {e}")
 
 
-if __name__ == "__main__":
-    input_file = "data.txt"
-    output_file = "cleaned_data.txt"
-    csv_file = "cleaned_data.csv"
+# Outputs that can be picked with --only
+OUTPUTS = ['text', 'csv', 'verify', 'pulls', 'stats', 'offenders', 'mistakes', 'cause-rates', 'rates', 'pairs']
+DEFAULT_OUTPUTS = ['text', 'csv', 'verify']
+# What --last prints when no outputs are picked
+LAST_OUTPUTS = ['pulls', 'stats', 'offenders', 'mistakes']
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Clean Discord bot raid output.")
+    parser.add_argument("input", nargs="?", default="data.txt",
+                        help="bot output, Discord JSON export, or a compressed copy (default: data.txt)")
+    parser.add_argument("-o", "--output", default="cleaned_data.txt",
+                        help="cleaned text report (default: cleaned_data.txt)")
+    parser.add_argument("--csv", default="cleaned_data.csv",
+                        help="player statistics CSV (default: cleaned_data.csv)")
+    parser.add_argument("--verify-output", default="verification_results.txt",
+                        help="verification report (default: verification_results.txt)")
+    parser.add_argument("--boss", help="skip auto-detection (e.g. nexus-king, gallywix)")
+    parser.add_argument("--last", type=at_least(1), metavar="N",
+                        help="only the last N attempts, found by reading the file backwards; "
+                             "prints their pulls and stats unless outputs are picked")
+    parser.add_argument("--write-index", action="store_true",
+                        help="also save byte offsets of every attempt to <input>.idx")
+    parser.add_argument("--pulls", type=parse_pull_range,
+                        help="only these cleaned pulls, e.g. 47 or 40-50, read through <input>.idx "
+                             "(built first if missing or stale); prints them unless outputs are picked")
+    parser.add_argument("--since", type=parse_date, help="like --pulls, for attempts from this date (YYYY-MM-DD)")
+    parser.add_argument("--until", type=lambda value: parse_date(value, end=True),
+                        help="like --pulls, for attempts up to this date (YYYY-MM-DD)")
+
+    outputs = parser.add_argument_group("outputs", "only the requested outputs are computed")
+    outputs.add_argument("--only", action="append", choices=OUTPUTS, metavar="OUTPUT",
+                         help=f"produce only this output (repeatable): {', '.join(OUTPUTS)}")
+    outputs.add_argument("--no-text", action="store_true", help="skip the cleaned text report")
+    outputs.add_argument("--no-csv", action="store_true", help="skip the CSV export")
+    outputs.add_argument("--no-verify", action="store_true", help="skip verification")
+    outputs.add_argument("--stats-only", action="store_true",
+                         help="print player stats, worst offenders and non-player mistakes; write no files")
+    outputs.add_argument("--offenders-only", action="store_true",
+                         help="print just the worst offenders block")
+    outputs.add_argument("--events", metavar="PATH",
+                         help="also stream one row per event to PATH (.jsonl for JSON Lines, else CSV)")
+    outputs.add_argument("--events-summary", metavar="PATH",
+                         help="also write a per-player CSV with one column per boss death cause")
+
+    parser.add_argument("--per", choices=['pull', 'minute'], default='pull',
+                        help="unit for the 'cause-rates' and 'rates' outputs (default: pull)")
+    parser.add_argument("--resamples", type=at_least(1), default=2000,
+                        help="bootstrap resamples for the 'rates' output (default: 2000)")
+    parser.add_argument("--top", type=at_least(1), default=10,
+                        help="pairs to list in the 'pairs' output (default: 10)")
+    parser.add_argument("--workers", type=at_least(0), default=1,
+                        help="parse in parallel with this many processes (0 = one per CPU)")
+    args = parser.parse_args(argv)
+    if args.last and (args.pulls or args.since or args.until):
+        parser.error("--last can't be combined with --pulls, --since or --until")
+    if args.last and args.write_index:
+        parser.error("--last only reads the end of the file, so it can't --write-index")
+
+    if args.offenders_only:
+        args.outputs = ['offenders']
+    elif args.stats_only:
+        args.outputs = ['stats', 'offenders', 'mistakes']
+    elif args.only:
+        args.outputs = [name for name in OUTPUTS if name in args.only]
+    elif args.last or args.pulls or args.since or args.until:
+        # Partial reads print and never write files, so --no-* has nothing to skip
+        args.outputs = LAST_OUTPUTS
+    else:
+        skipped = {'text': args.no_text, 'csv': args.no_csv, 'verify': args.no_verify}
+        args.outputs = [name for name in DEFAULT_OUTPUTS if not skipped[name]]
+    return args
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = parse_args(argv)
+    outputs = args.outputs
+    # Printing reports to stdout (e.g. for a relay bot) means no chatter
+    quiet = not any(name in outputs for name in DEFAULT_OUTPUTS)
     
     # Figure out which boss we're dealing with
+    report = RaidReport(args.input, workers=args.workers or None, last=args.last,
+                        write_index=args.write_index, pulls=args.pulls, since=args.since, until=args.until)
     try:
-        with open(input_file, 'r', encoding='utf-8') as f:
-            content = f.read()
-            boss = detect_boss_from_content(content)
+        if (report.write_index or report.selecting) and not report.seekable:
+            print(f"Error: {args.input} can't be indexed - offsets need an uncompressed text file")
+            return 1
+        if args.boss:
+            report.boss = get_boss(args.boss)
+        else:
+            report.boss
     except FileNotFoundError:
-        print(f"Error: Could not find {input_file}")
+        print(f"Error: Could not find {args.input}")
         print("Make sure you have copied the Discord bot output to data.txt")
-        exit(1)
+        return 1
     except Exception as e:
-        print(f"Error reading {input_file}: {e}")
-        exit(1)
+        print(f"Error reading {args.input}: {e}")
+        return 1
+    boss = report.boss
+    
+    if not quiet:
+        print(f"{'Boss' if args.boss else 'Auto-detected boss'}: {boss.name}")
+        print(f"Boss mechanics: {', '.join(boss.mechanics)}")
     
-    print(f"Auto-detected boss: {boss.name}")
-    print(f"Boss mechanics: {', '.join(boss.mechanics)}")
+    try:
+        if 'text' in outputs:
+            report.write_text(args.output)
+            print(f"Data has been cleaned and saved to {args.output}")
+        if 'csv' in outputs:
+            export_to_csv(report.attempts, args.csv, report.player_stats)
+            print(f"CSV data has been saved to {args.csv}")
+        if 'verify' in outputs:
+            print("\nVerifying cleaning process...")
+            report.write_verification(args.verify_output)
+            print(f"Verification results have been saved to {args.verify_output}")
+        if 'pulls' in outputs:
+            print("\n".join(report.output_lines))
+        if 'stats' in outputs:
+            print(report.stats_output)
+        if 'offenders' in outputs:
+            print(report.worst_offenders)
+        if 'mistakes' in outputs:
+            print(report.mistakes_output)
+        if 'cause-rates' in outputs:
+            print(report.cause_rates_output(args.per))
+        if 'rates' in outputs:
+            print(report.rates_output(args.per, args.resamples))
+        if 'pairs' in outputs:
+            print(report.pairs_output(args.top))
+        if args.write_index:
+            report.attempts  # Parsing writes the index
+            if not quiet:
+                print(f"Attempt index saved to {index_path(args.input)}")
+    except FileNotFoundError:
+        print(f"Error: Could not find {args.input}")
+        return 1
+    except Exception as e:
+        print(f"Error processing {args.input}: {e}")
+        return 1
     
-    clean_data(input_file, output_file, csv_file, boss)
+    try:
+        if args.events:
+            fmt = 'jsonl' if args.events.endswith(('.jsonl', '.json')) else 'csv'
+            with event_attempts(report) as attempts:
+                export_events(attempts, args.events, fmt)
+        if args.events_summary:
+            with event_attempts(report) as attempts:
+                export_event_summary(attempts, args.events_summary, boss)
+    except Exception as e:
+        print(f"Error exporting events: {e}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -3,14 +3,15 @@ CSV export functionality.
 """
 
 import csv
-from typing import List, Any
+from typing import List, Any, Dict
 
 
-def export_to_csv(attempts: List[Any], output_file: str) -> None:
-    """Export player statistics to CSV format."""
+def export_to_csv(attempts: List[Any], output_file: str, player_stats: Dict[str, Dict[str, int]] = None) -> None:
+    """Export player statistics to CSV format (reuses player_stats if given)."""
     from analyzers.player_stats import analyze_player_stats
     
-    player_stats = analyze_player_stats(attempts)
+    if player_stats is None:
+        player_stats = analyze_player_stats(attempts)
     rows = []
     
     for player, mistakes in player_stats.items():
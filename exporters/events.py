@@ -0,0 +1,103 @@
+"""
+Event-level export - one row per event, streamed straight from the parser.
+"""
+
+import csv
+import json
+import re
+from collections import defaultdict
+from typing import Iterable, Iterator, List, Dict, Any
+
+EVENT_FIELDS = ['Night', 'Boss', 'Pull', 'Player', 'Cause', 'Fight_Time', 'Fatal']
+
+
+def iter_event_rows(attempts: Iterable[Any]) -> Iterator[Dict[str, Any]]:
+    """Yield one row per event, in the order the attempts arrive."""
+    for attempt in attempts:
+        night = attempt.datetime.date().isoformat() if attempt.datetime else ""
+        for event in attempt.events:
+            if "No mistakes found" in event:
+                continue
+            player, cause = attempt.boss.extract_player_death(event)
+            # Fight time is the trailing "(m:ss)" on the bot's event lines
+            time_match = re.search(r"\((\d+:\d{2})\)\s*$", event)
+            if not cause:
+                # Non-player mistakes keep their text, minus the fight time
+                cause = re.sub(r"\s*\(\d+:\d{2}\)\s*$", "", event.strip())
+            yield {
+                'Night': night,
+                'Boss': attempt.boss.name,
+                'Pull': attempt.pull_number,
+                'Player': player or "",
+                'Cause': cause,
+                'Fight_Time': time_match.group(1) if time_match else "",
+                'Fatal': "died" in event or "killed" in event,
+            }
+
+
+def export_events(attempts: Iterable[Any], output_file: str, fmt: str = 'csv') -> int:
+    """Write event rows as CSV or JSON Lines without holding them in memory.
+
+    Pass iter_attempts() over an open file to stream from the raw input.
+    Returns the number of rows written.
+    """
+    if fmt not in ('csv', 'jsonl'):
+        raise ValueError(f"Unknown event format: {fmt} (expected 'csv' or 'jsonl')")
+
+    count = 0
+    with open(output_file, 'w', newline='', encoding='utf-8') as f:
+        if fmt == 'csv':
+            writer = csv.DictWriter(f, fieldnames=EVENT_FIELDS)
+            writer.writeheader()
+            for row in iter_event_rows(attempts):
+                writer.writerow(row)
+                count += 1
+        else:
+            for row in iter_event_rows(attempts):
+                f.write(json.dumps(row) + "\n")
+                count += 1
+    print(f"Wrote {count} events to {output_file}")
+    return count
+
+
+def summary_columns(boss) -> List[str]:
+    """Per-boss summary columns, taken from the boss's death causes."""
+    columns = []
+    for cause in boss.death_causes or boss.mechanics:
+        if cause not in columns:
+            columns.append(cause)
+    return columns
+
+
+def export_event_summary(attempts: Iterable[Any], output_file: str, boss) -> None:
+    """Write one row per player with a column per death cause of the boss.
+
+    Events are matched to the longest death cause that appears in their
+    text, so "Giga Blast Residue" doesn't count as "Giga Blast".
+    """
+    columns = summary_columns(boss)
+    by_length = sorted(columns, key=len, reverse=True)
+    totals = defaultdict(lambda: defaultdict(int))
+
+    for attempt in attempts:
+        for event in attempt.events:
+            player, cause = attempt.boss.extract_player_death(event)
+            if not (player and cause):
+                continue
+            column = next((name for name in by_length if name.lower() in event.lower()), 'Other')
+            totals[player][column] += 1
+            totals[player]['Total'] += 1
+            if "died" in event or "killed" in event:
+                totals[player]['Fatal'] += 1
+
+    rows = [
+        [player, counts['Total'], counts['Fatal']] + [counts[name] for name in columns] + [counts['Other']]
+        for player, counts in totals.items()
+    ]
+    rows.sort(key=lambda x: x[1], reverse=True)
+
+    with open(output_file, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f)
+        writer.writerow(['Player', 'Total_Mistakes', 'Fatal'] + columns + ['Other'])
+        writer.writerows(rows)
+    print(f"Wrote {len(rows)} player summaries to {output_file}")
@@ -0,0 +1,3 @@
+"""
+Persistent indexes over parsed raid data.
+"""
@@ -0,0 +1,201 @@
+"""
+History index - persistent postings lists over every parsed night so
+ad-hoc questions don't need the raw text reparsed.
+"""
+
+import heapq
+import json
+import os
+from bisect import bisect_left
+from datetime import datetime
+from typing import List, Dict, Any, Optional, Tuple
+
+INDEX_VERSION = 1
+
+
+class HistoryIndex:
+    """On-disk index of player mistakes across parsed nights.
+
+    Attempts are kept sorted by datetime so a date range is two bisects,
+    and events are numbered in attempt order so every postings list is
+    sorted and can be sliced to that range the same way.
+    """
+
+    def __init__(self):
+        self.nights: List[Dict[str, Any]] = []
+        self.attempts: List[List[Any]] = []  # [night, pull, boss, when, duration]
+        self.events: List[List[Any]] = []  # [attempt, player, cause]
+        self.times: List[str] = []  # ISO datetime of each attempt (sorted)
+        self.event_starts: List[int] = [0]  # first event id of each attempt
+        self.players: Dict[str, List[int]] = {}
+        self.causes: Dict[str, List[int]] = {}
+        self._player_keys: Dict[str, str] = {}
+
+    @classmethod
+    def load(cls, path: str) -> 'HistoryIndex':
+        """Load an index written by save()."""
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        if data.get('version') != INDEX_VERSION:
+            raise ValueError(f"Unsupported index version in {path}: {data.get('version')}")
+
+        index = cls()
+        index.nights = data['nights']
+        index.attempts = data['attempts']
+        index.events = data['events']
+        index.times = data['times']
+        index.event_starts = data['event_starts']
+        index.players = data['players']
+        index.causes = data['causes']
+        index._player_keys = {player.lower(): player for player in index.players}
+        return index
+
+    def save(self, path: str) -> None:
+        """Write the index to disk."""
+        data = {
+            'version': INDEX_VERSION,
+            'nights': self.nights,
+            'attempts': self.attempts,
+            'events': self.events,
+            'times': self.times,
+            'event_starts': self.event_starts,
+            'players': self.players,
+            'causes': self.causes,
+        }
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, separators=(',', ':'))
+
+    def is_current(self, source: str) -> bool:
+        """Check if a night file is already indexed and unchanged on disk."""
+        source = os.path.abspath(source)
+        stat = os.stat(source)
+        for night in self.nights:
+            if night['source'] == source:
+                return night['size'] == stat.st_size and night['mtime'] == stat.st_mtime
+        return False
+
+    def add_night(self, source: str, attempts: List[Any]) -> None:
+        """Add one parsed night, replacing any earlier version of the same file.
+
+        attempts should be in the order clean_data() reports them, so pull
+        numbers here match the renumbered pulls in cleaned_data.txt.
+        """
+        source = os.path.abspath(source)
+        stat = os.stat(source)
+        night_info = {
+            'source': source,
+            'boss': attempts[0].boss.name if attempts else None,
+            'size': stat.st_size,
+            'mtime': stat.st_mtime,
+            'attempts': len(attempts),
+        }
+
+        night_id = next((i for i, night in enumerate(self.nights) if night['source'] == source), None)
+        if night_id is None:
+            night_id = len(self.nights)
+            self.nights.append(night_info)
+        else:
+            self.nights[night_id] = night_info
+
+        # Regroup the existing events by attempt, minus the night being replaced
+        grouped = []
+        for i, record in enumerate(self.attempts):
+            if record[0] == night_id:
+                continue
+            deaths = [(player, cause) for _, player, cause in self.events[self.event_starts[i]:self.event_starts[i + 1]]]
+            grouped.append((record, deaths))
+
+        for pull, attempt in enumerate(attempts, 1):
+            when = attempt.datetime.isoformat() if attempt.datetime else ""
+            record = [night_id, pull, attempt.boss.name, when, attempt.duration]
+            deaths = []
+            for event in attempt.events:
+                player, cause = attempt.boss.extract_player_death(event)
+                if player and cause:
+                    deaths.append((player, cause))
+            grouped.append((record, deaths))
+
+        self._rebuild(grouped)
+
+    def _rebuild(self, grouped: List[Tuple[List[Any], List[Tuple[str, str]]]]) -> None:
+        """Renumber attempts and events and regenerate the postings lists."""
+        grouped.sort(key=lambda x: (x[0][3], x[0][0], x[0][1]))
+
+        self.attempts = []
+        self.events = []
+        self.times = []
+        self.event_starts = [0]
+        self.players = {}
+        self.causes = {}
+
+        for attempt_id, (record, deaths) in enumerate(grouped):
+            self.attempts.append(record)
+            self.times.append(record[3])
+            for player, cause in deaths:
+                event_id = len(self.events)
+                self.events.append([attempt_id, player, cause])
+                self.players.setdefault(player, []).append(event_id)
+                self.causes.setdefault(cause, []).append(event_id)
+            self.event_starts.append(len(self.events))
+
+        self._player_keys = {player.lower(): player for player in self.players}
+
+    def query(self, player: Optional[str] = None, boss: Optional[str] = None,
+              cause: Optional[str] = None, pulls: Optional[Tuple[int, int]] = None,
+              since: Optional[datetime] = None, until: Optional[datetime] = None) -> List[Dict[str, Any]]:
+        """Find events matching every given filter.
+
+        player matches exactly (case-insensitive), boss and cause match as
+        substrings, pulls is an inclusive range, since is inclusive and
+        until is exclusive.
+        """
+        # Narrow to the attempts inside the date range
+        first_attempt = bisect_left(self.times, since.isoformat()) if since else 0
+        last_attempt = bisect_left(self.times, until.isoformat()) if until else len(self.times)
+        if first_attempt >= last_attempt:
+            return []
+        low, high = self.event_starts[first_attempt], self.event_starts[last_attempt]
+
+        postings = []
+        if player is not None:
+            key = self._player_keys.get(player.lower())
+            if key is None:
+                return []
+            postings.append(_slice_postings(self.players[key], low, high))
+        if cause is not None:
+            cause_lower = cause.lower()
+            matching = [_slice_postings(ids, low, high) for name, ids in self.causes.items() if cause_lower in name.lower()]
+            if not matching:
+                return []
+            postings.append(list(heapq.merge(*matching)))
+
+        if postings:
+            postings.sort(key=len)
+            others = [set(ids) for ids in postings[1:]]
+            candidates = [event_id for event_id in postings[0] if all(event_id in ids for ids in others)]
+        else:
+            candidates = range(low, high)
+
+        boss_lower = boss.lower() if boss else None
+        results = []
+        for event_id in candidates:
+            attempt_id, event_player, event_cause = self.events[event_id]
+            night_id, pull, boss_name, when, duration = self.attempts[attempt_id]
+            if boss_lower and boss_lower not in boss_name.lower():
+                continue
+            if pulls and not (pulls[0] <= pull <= pulls[1]):
+                continue
+            results.append({
+                'when': when,
+                'source': self.nights[night_id]['source'],
+                'boss': boss_name,
+                'pull': pull,
+                'player': event_player,
+                'cause': event_cause,
+            })
+        return results
+
+
+def _slice_postings(ids: List[int], low: int, high: int) -> List[int]:
+    """Cut a sorted postings list down to event ids in [low, high)."""
+    return ids[bisect_left(ids, low):bisect_left(ids, high)]
@@ -0,0 +1,145 @@
+"""
+Offset index - a sidecar file next to a big input that records where every
+attempt lives, so one pull or one evening can be re-parsed on its own.
+"""
+
+import io
+import json
+import os
+import zlib
+from bisect import bisect_left
+from datetime import datetime
+from typing import List, Any, Optional, Tuple
+
+from parsers.attempts import iter_segments, build_attempt
+from parsers.parallel import iter_offset_lines
+
+OFFSETS_VERSION = 1
+
+
+def index_path(input_file: str) -> str:
+    """Where the sidecar index for an input lives."""
+    return input_file + ".idx"
+
+
+class OffsetIndex:
+    """Byte ranges of every attempt in one uncompressed input file.
+
+    Entries are in the order clean_data() reports attempts (sorted by
+    time), so cleaned pull N is entry N - 1 and a time range is two
+    bisects. Each range runs from the attempt's header to the next header
+    the parser accepted, and carries a CRC-32 of those bytes so edits to
+    the input are caught when the slice is read back.
+    """
+
+    def __init__(self, size: int = 0, boss: Optional[str] = None):
+        self.size = size
+        self.boss = boss
+        self.entries: List[List[Any]] = []  # [start, end, pull, when, crc]
+
+    @classmethod
+    def build(cls, input_file: str, boss) -> Tuple['OffsetIndex', List[Any]]:
+        """Parse the whole input once, returning the index and the sorted attempts."""
+        index = cls(os.path.getsize(input_file), boss.name)
+        found = []  # (attempt, start)
+        with open(input_file, 'rb') as f:
+            for segment in iter_segments(iter_offset_lines(f), boss):
+                attempt = build_attempt(segment, boss)
+                found.append((attempt, segment['start']))
+
+            # An attempt ends where the next accepted header starts
+            ends = [start for _, start in found[1:]] + [index.size]
+            parsed = []
+            for (attempt, start), end in zip(found, ends):
+                # Filter out empty attempts (sometimes from other bosses)
+                if not (attempt and attempt.events):
+                    continue
+                f.seek(start)
+                crc = zlib.crc32(f.read(end - start))
+                when = attempt.datetime.isoformat() if attempt.datetime else None
+                parsed.append((attempt, [start, end, attempt.pull_number, when, crc]))
+
+        # Sort by timestamp to get chronological order
+        parsed.sort(key=lambda x: x[0].datetime)
+        index.entries = [entry for _, entry in parsed]
+        return index, [attempt for attempt, _ in parsed]
+
+    @classmethod
+    def load(cls, path: str) -> 'OffsetIndex':
+        """Load an index written by save()."""
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        if data.get('version') != OFFSETS_VERSION:
+            raise ValueError(f"Unsupported index version in {path}: {data.get('version')}")
+
+        index = cls(data['size'], data['boss'])
+        index.entries = data['attempts']
+        return index
+
+    def save(self, path: str) -> None:
+        """Write the index to disk."""
+        data = {
+            'version': OFFSETS_VERSION,
+            'size': self.size,
+            'boss': self.boss,
+            'attempts': self.entries,
+        }
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, separators=(',', ':'))
+
+    def is_current(self, input_file: str) -> bool:
+        """Check the input still matches: same size, and the first and last
+        attempts still checksum the same (a full check would mean reading
+        the whole file, which is what the index is there to avoid)."""
+        if os.path.getsize(input_file) != self.size:
+            return False
+        ends = self.entries[:1] + self.entries[1:][-1:]
+        with open(input_file, 'rb') as f:
+            return all(self._read(f, entry) is not None for entry in ends)
+
+    def select(self, pulls: Optional[Tuple[int, int]] = None, since: Optional[datetime] = None,
+               until: Optional[datetime] = None) -> Tuple[int, int]:
+        """Entry range [first, last) for an inclusive cleaned pull range and/or
+        a time range (since inclusive, until exclusive)."""
+        first, last = 0, len(self.entries)
+        if pulls:
+            first, last = max(pulls[0] - 1, 0), min(pulls[1], last)
+        if since or until:
+            times = [entry[3] or "" for entry in self.entries]
+            if since:
+                first = max(first, bisect_left(times, since.isoformat()))
+            if until:
+                last = min(last, bisect_left(times, until.isoformat()))
+        return first, max(first, last)
+
+    def read_attempts(self, input_file: str, first: int, last: int, boss) -> List[Any]:
+        """Re-parse just the attempts in entries[first:last].
+
+        Raises ValueError if any slice no longer matches its checksum.
+        """
+        attempts = []
+        with open(input_file, 'rb') as f:
+            for entry in self.entries[first:last]:
+                data = self._read(f, entry)
+                if data is None:
+                    raise ValueError(f"{input_file} has changed since it was indexed (pull #{entry[2]} at byte {entry[0]})")
+                segment = next(iter_segments(iter_offset_lines(io.BytesIO(data)), boss))
+                attempts.append(build_attempt(segment, boss))
+        return attempts
+
+    @staticmethod
+    def _read(f, entry: List[Any]) -> Optional[bytes]:
+        """The bytes of one entry, or None if they don't match its checksum."""
+        start, end, _, _, crc = entry
+        f.seek(start)
+        data = f.read(end - start)
+        return data if zlib.crc32(data) == crc else None
+
+
+def load_current_index(input_file: str) -> Optional[OffsetIndex]:
+    """The sidecar index for an input, or None if it's missing or stale."""
+    try:
+        index = OffsetIndex.load(index_path(input_file))
+    except (FileNotFoundError, ValueError, KeyError):
+        return None
+    return index if index.is_current(input_file) else None
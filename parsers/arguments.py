@@ -0,0 +1,42 @@
+"""
+Command-line argument types shared by clean_data.py and query_data.py.
+"""
+
+import argparse
+from datetime import datetime, timedelta
+from typing import Tuple
+
+
+def parse_pull_range(value: str) -> Tuple[int, int]:
+    """Parse "10-20" or "7" into an inclusive pull range."""
+    try:
+        if '-' in value:
+            low, high = value.split('-', 1)
+            return int(low), int(high)
+        return int(value), int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"Invalid pull range: {value}")
+
+
+def parse_date(value: str, end: bool = False) -> datetime:
+    """Parse YYYY-MM-DD (or full ISO) - date-only ends cover the whole day."""
+    try:
+        moment = datetime.fromisoformat(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"Invalid date: {value}")
+    if end and len(value) == 10:
+        moment += timedelta(days=1)
+    return moment
+
+
+def at_least(minimum: int):
+    """argparse type for an integer no smaller than minimum."""
+    def parse(value: str) -> int:
+        try:
+            number = int(value)
+        except ValueError:
+            raise argparse.ArgumentTypeError(f"Invalid number: {value}")
+        if number < minimum:
+            raise argparse.ArgumentTypeError(f"Must be at least {minimum}, got {number}")
+        return number
+    return parse
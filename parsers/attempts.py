@@ -0,0 +1,126 @@
+"""
+Attempt parsing - turns Discord bot lines into boss attempts.
+"""
+
+import re
+from typing import Iterable, Iterator, List, Dict, Any, Optional, Tuple
+
+from .timestamp import is_timestamp, parse_timestamp
+
+
+class Attempt:
+    """Represents a single boss attempt."""
+
+    def __init__(self, header: str, events: List[str], timestamp: str, boss):
+        self.header = header
+        self.events = events
+        self.timestamp = timestamp
+        self.datetime = parse_timestamp(timestamp)
+        self.boss = boss
+        # Extract duration from header
+        duration_match = re.search(r"\((\d+):(\d+)\)", header)
+        if duration_match:
+            minutes, seconds = map(int, duration_match.groups())
+            self.duration = minutes * 60 + seconds
+        else:
+            self.duration = 0
+        # Pull number as the bot sent it (before renumbering)
+        pull_match = re.search(r'#(\d+)', header)
+        self.pull_number = int(pull_match.group(1)) if pull_match else None
+
+    def format_attempt(self, attempt_number: int) -> List[str]:
+        """Format the attempt with the new number."""
+        duration = self.header.split('(')[1]
+        return [self.boss.format_attempt(attempt_number, self.header, duration)] + self.events + [self.timestamp]
+
+
+def clean_line(line: str) -> str:
+    """Strip bot warnings and emoji codes from a raw line."""
+    line = line.strip()
+    if not line:
+        return ""
+    # Skip Discord bot warnings
+    if ":warning: Experimental :warning:" in line:
+        return ""
+
+    # Remove Discord emoji patterns like :NexusKing_Spirits: :Monk~3:
+    # This is a bit hacky but works for the bot's output format
+    cleaned_line = re.sub(r':[^:]+:\s*:[^:]+:\s*', '', line)
+
+    # Fallback for stubborn emoji patterns
+    if ':NexusKing_' in cleaned_line or ':Shaman~' in cleaned_line or ':Warlock~' in cleaned_line:
+        cleaned_line = re.sub(r':[^:]+:', '', cleaned_line).strip()
+
+    return cleaned_line
+
+
+def iter_segments(numbered_lines: Iterable[Tuple[int, str]], boss) -> Iterator[Dict[str, Any]]:
+    """Yield one raw segment per accepted attempt header.
+
+    numbered_lines pairs each line with its position (line number or byte
+    offset), which is recorded as the segment's start. Segments may still
+    lack a timestamp - build_attempt() decides whether they count.
+    """
+    segment = None
+
+    for position, line in numbered_lines:
+        cleaned_line = clean_line(line)
+        if not cleaned_line:
+            continue
+
+        # Look for boss attempt headers like "Nexus-King #1 (2:33)"
+        if boss.is_attempt_header(cleaned_line):
+            pull_match = re.search(r'#(\d+)', cleaned_line)
+            if pull_match:
+                pull_number = int(pull_match.group(1))
+                # Skip duplicate pull numbers (sometimes the bot sends duplicates)
+                if segment and pull_number == segment['pull']:
+                    continue
+                if segment:
+                    yield segment
+                segment = {
+                    'start': position,
+                    'header': cleaned_line,
+                    'pull': pull_number,
+                    'events': [],
+                    'timestamp': None,
+                }
+            continue
+
+        # Process events for the current attempt
+        if segment:
+            if is_timestamp(cleaned_line):
+                segment['timestamp'] = cleaned_line
+            elif boss.is_boss_event(cleaned_line):
+                segment['events'].append("  " + cleaned_line)  # Indent for readability
+
+    # Don't forget the last attempt
+    if segment:
+        yield segment
+
+
+def build_attempt(segment: Dict[str, Any], boss) -> Optional[Attempt]:
+    """Turn a segment into an Attempt, or None if it never got a timestamp."""
+    if not segment['timestamp']:
+        return None
+    # Clean up "Part X" suffixes from headers
+    header = re.sub(r'\s*-\s*Part\s+\d+', '', segment['header'])
+    return Attempt(header, segment['events'], segment['timestamp'], boss)
+
+
+def iter_attempts(lines: Iterable[str], boss) -> Iterator[Attempt]:
+    """Yield attempts in file order as soon as they are complete."""
+    for segment in iter_segments(enumerate(lines), boss):
+        attempt = build_attempt(segment, boss)
+        if attempt:
+            yield attempt
+
+
+def parse_attempts(lines: Iterable[str], boss) -> List[Attempt]:
+    """Parse all attempts, dropping empty ones and sorting by timestamp."""
+    # Filter out empty attempts (sometimes from other bosses)
+    attempts = [attempt for attempt in iter_attempts(lines, boss) if attempt.events]
+
+    # Sort by timestamp to get chronological order
+    attempts.sort(key=lambda x: x.datetime)
+    return attempts
@@ -0,0 +1,149 @@
+"""
+Discord JSON export adapter - streams messages out of channel exports
+(DiscordChatExporter format) and turns them into bot output lines.
+"""
+
+import json
+from datetime import datetime
+from typing import Any, Dict, Iterator, TextIO
+
+CHUNK_SIZE = 64 * 1024
+WHITESPACE = ' \t\n\r\ufeff'
+
+
+class _JSONStream:
+    """Just enough of an incremental JSON reader to walk an export.
+
+    Only one value is ever decoded at a time, and consumed text is dropped
+    from the buffer, so memory depends on the largest message rather than
+    on the size of the export.
+    """
+
+    def __init__(self, f: TextIO, chunk_size: int = CHUNK_SIZE):
+        self.f = f
+        self.chunk_size = chunk_size
+        self.buffer = ""
+        self.pos = 0
+        self.eof = False
+        self.decoder = json.JSONDecoder()
+
+    def _fill(self) -> bool:
+        data = self.f.read(self.chunk_size)
+        if not data:
+            self.eof = True
+            return False
+        self.buffer = self.buffer[self.pos:] + data
+        self.pos = 0
+        return True
+
+    def peek(self) -> str:
+        """Next non-whitespace character, or '' at the end of the input."""
+        while True:
+            while self.pos < len(self.buffer) and self.buffer[self.pos] in WHITESPACE:
+                self.pos += 1
+            if self.pos < len(self.buffer) or not self._fill():
+                return self.buffer[self.pos:self.pos + 1]
+
+    def expect(self, char: str) -> None:
+        found = self.peek()
+        if found != char:
+            raise ValueError(f"Malformed Discord export: expected {char!r}, found {found or 'end of file'!r}")
+        self.pos += 1
+
+    def skip(self, char: str) -> bool:
+        """Consume char if it's next."""
+        if self.peek() == char:
+            self.pos += 1
+            return True
+        return False
+
+    def value(self) -> Any:
+        """Decode the next complete JSON value."""
+        self.peek()
+        while True:
+            try:
+                value, end = self.decoder.raw_decode(self.buffer, self.pos)
+            except json.JSONDecodeError:
+                if self._fill():
+                    continue
+                raise ValueError("Malformed Discord export: truncated or invalid JSON")
+            # A number at the very end of the buffer might continue in the next chunk
+            if end == len(self.buffer) and not self.eof and self._fill():
+                continue
+            self.pos = end
+            return value
+
+    def array_items(self) -> Iterator[Any]:
+        """Yield the items of the array starting at the current position."""
+        self.expect('[')
+        if self.skip(']'):
+            return
+        while True:
+            yield self.value()
+            if self.skip(']'):
+                return
+            self.expect(',')
+
+
+def iter_discord_messages(f: TextIO) -> Iterator[Dict[str, Any]]:
+    """Yield messages one at a time from an export (or a bare message array)."""
+    stream = _JSONStream(f)
+    if stream.peek() == '[':
+        yield from stream.array_items()
+        return
+
+    stream.expect('{')
+    if stream.skip('}'):
+        return
+    while True:
+        key = stream.value()
+        stream.expect(':')
+        if key == 'messages' and stream.peek() == '[':
+            yield from stream.array_items()
+        else:
+            stream.value()  # guild, channel, dateRange, ... are small
+        if stream.skip('}'):
+            return
+        stream.expect(',')
+
+
+def format_message_timestamp(value: str) -> str:
+    """Turn an export timestamp into a line parse_timestamp() understands.
+
+    Keeps the wall-clock time in the export's own time zone, which is what
+    Discord showed whoever made the export.
+    """
+    moment = datetime.fromisoformat(value.replace('Z', '+00:00'))
+    return moment.replace(tzinfo=None).isoformat(sep=' ')
+
+
+def message_lines(message: Dict[str, Any]) -> Iterator[str]:
+    """The text lines of a message as they'd appear when copied from Discord."""
+    for line in (message.get('content') or "").splitlines():
+        yield line
+    for embed in message.get('embeds') or []:
+        for key in ('title', 'description'):
+            for line in (embed.get(key) or "").splitlines():
+                yield line
+        for field in embed.get('fields') or []:
+            for key in ('name', 'value'):
+                for line in (field.get(key) or "").splitlines():
+                    yield line
+
+
+def iter_discord_export_lines(f: TextIO, bots_only: bool = True) -> Iterator[str]:
+    """Yield bot output lines from a Discord JSON export.
+
+    Each message's text is followed by its exact timestamp, which ends the
+    attempt just like the "Today at ..." line in copied text. With
+    bots_only, chatter from people in the channel is skipped.
+    """
+    for message in iter_discord_messages(f):
+        if bots_only and not (message.get('author') or {}).get('isBot', True):
+            continue
+        lines = list(message_lines(message))
+        if not lines:
+            continue
+        yield from lines
+        if message.get('timestamp'):
+            yield format_message_timestamp(message['timestamp'])
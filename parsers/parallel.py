@@ -0,0 +1,137 @@
+"""
+Parallel attempt parsing - splits one big input at attempt headers and
+parses the chunks in a process pool.
+"""
+
+import os
+import re
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Dict, Any, Iterator, Tuple
+
+from .attempts import clean_line, iter_segments, build_attempt
+
+# Chunks per worker, so one slow chunk doesn't leave the others idle
+CHUNKS_PER_WORKER = 4
+
+LINE_BREAK = re.compile(r'(\r\n|\r|\n)')
+
+
+def iter_offset_lines(f, start: int = 0, end: int = None) -> Iterator[Tuple[int, str]]:
+    """Yield (byte offset, line) pairs from a binary file between start and end."""
+    f.seek(start)
+    offset = start
+    for raw in f:
+        if end is not None and offset >= end:
+            break
+        line = raw.decode('utf-8')
+        if '\r' in line.rstrip('\r\n'):
+            # Lone carriage returns end a line in open(..., 'r') too, and
+            # each piece gets its own offset so it can be seeked to
+            pieces = LINE_BREAK.split(line)
+            piece_offset = offset
+            for piece, separator in zip(pieces[::2], pieces[1::2] + [""]):
+                if end is not None and piece_offset >= end:
+                    return
+                yield piece_offset, piece
+                piece_offset += len((piece + separator).encode('utf-8'))
+        else:
+            yield offset, line
+        offset += len(raw)
+
+
+def find_header_offsets(input_file: str, boss) -> List[int]:
+    """Byte offsets of every line that looks like an attempt header."""
+    offsets = []
+    with open(input_file, 'rb') as f:
+        for offset, line in iter_offset_lines(f):
+            # Every header has a pull number, so skip the cleaning for most lines
+            if '#' not in line:
+                continue
+            cleaned_line = clean_line(line)
+            if boss.is_attempt_header(cleaned_line) and re.search(r'#(\d+)', cleaned_line):
+                offsets.append(offset)
+    return offsets
+
+
+def split_chunks(offsets: List[int], size: int, count: int) -> List[Tuple[int, int]]:
+    """Cut [0, size) into about count byte ranges starting at header offsets."""
+    if not offsets or count < 2:
+        return [(0, size)]
+
+    cuts = [0]
+    target = size / count
+    for offset in offsets:
+        if offset - cuts[-1] >= target:
+            cuts.append(offset)
+    cuts.append(size)
+    return list(zip(cuts[:-1], cuts[1:]))
+
+
+def _parse_chunk(task: Tuple[str, int, int, Any]) -> List[Dict[str, Any]]:
+    """Worker: parse one chunk into segments with their player deaths."""
+    input_file, start, end, boss = task
+    segments = []
+    with open(input_file, 'rb') as f:
+        for segment in iter_segments(iter_offset_lines(f, start, end), boss):
+            segment['deaths'] = []
+            for event in segment['events']:
+                player, cause = boss.extract_player_death(event)
+                if player and cause:
+                    segment['deaths'].append((player, cause))
+            segments.append(segment)
+    return segments
+
+
+def _merge_chunks(chunks: List[List[Dict[str, Any]]]) -> List[Dict[str, Any]]:
+    """Join per-chunk segments the way one serial pass would have."""
+    merged = []
+    for segments in chunks:
+        for i, segment in enumerate(segments):
+            # A chunk always opens on a header, which the serial pass would
+            # have skipped as a duplicate if it repeats the previous pull
+            if i == 0 and merged and segment['pull'] == merged[-1]['pull']:
+                previous = merged[-1]
+                previous['events'].extend(segment['events'])
+                previous['deaths'].extend(segment['deaths'])
+                if segment['timestamp']:
+                    previous['timestamp'] = segment['timestamp']
+                continue
+            merged.append(segment)
+    return merged
+
+
+def parse_attempts_parallel(input_file: str, boss, workers: int = None) -> Tuple[List[Any], Dict[str, Dict[str, int]]]:
+    """Parse a file in parallel, returning sorted attempts and player stats.
+
+    Gives the same results as parse_attempts() followed by
+    analyze_player_stats(), but the death extraction happens in the workers.
+    """
+    workers = workers or os.cpu_count() or 1
+    size = os.path.getsize(input_file)
+    offsets = find_header_offsets(input_file, boss)
+    tasks = [(input_file, start, end, boss) for start, end in split_chunks(offsets, size, workers * CHUNKS_PER_WORKER)]
+
+    if len(tasks) == 1 or workers == 1:
+        chunks = [_parse_chunk(task) for task in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            chunks = list(pool.map(_parse_chunk, tasks))
+
+    parsed = []
+    for segment in _merge_chunks(chunks):
+        attempt = build_attempt(segment, boss)
+        # Filter out empty attempts (sometimes from other bosses)
+        if attempt and attempt.events:
+            parsed.append((attempt, segment['deaths']))
+
+    # Sort by timestamp to get chronological order
+    parsed.sort(key=lambda x: x[0].datetime)
+
+    # Sum in chronological order so ties rank the same as analyze_player_stats()
+    player_stats = defaultdict(lambda: defaultdict(int))
+    for _, deaths in parsed:
+        for player, cause in deaths:
+            player_stats[player][cause] += 1
+
+    return [attempt for attempt, _ in parsed], player_stats
@@ -0,0 +1,67 @@
+"""
+Input sources - opens raw bot output whether it was copied into a text
+file or archived as a Discord JSON export, compressed or not.
+"""
+
+import bz2
+import gzip
+import lzma
+import re
+from contextlib import contextmanager
+from typing import Iterable, Iterator, TextIO
+
+from .discord_json import iter_discord_export_lines
+
+# An object, or an array of objects - copied text never starts like that
+JSON_START = re.compile(r'^[\s\ufeff]*(\{|\[\s*[{\]])')
+
+# Archived nights are detected by magic bytes, not by file extension
+COMPRESSION_MAGIC = [
+    (b'\x1f\x8b', gzip.open),
+    (b'\xfd7zXZ\x00', lzma.open),
+    (b'BZh', bz2.open),
+]
+
+
+def _compression(input_file: str):
+    """The opener for a compressed input, or None for an uncompressed one."""
+    with open(input_file, 'rb') as f:
+        head = f.read(6)
+    for magic, opener in COMPRESSION_MAGIC:
+        if head.startswith(magic):
+            return opener
+    return None
+
+
+def open_text(input_file: str) -> TextIO:
+    """Open an input as text, decompressing on the fly if needed."""
+    opener = _compression(input_file) or open
+    return opener(input_file, 'rt', encoding='utf-8')
+
+
+def _is_json(f: TextIO) -> bool:
+    head = f.read(256)
+    f.seek(0)
+    return bool(JSON_START.match(head))
+
+
+def is_plain_text(input_file: str) -> bool:
+    """Check if the input is uncompressed bot text (the only kind we can seek in)."""
+    if _compression(input_file):
+        return False
+    with open(input_file, 'r', encoding='utf-8') as f:
+        return not _is_json(f)
+
+
+@contextmanager
+def open_lines(input_file: str) -> Iterator[Iterable[str]]:
+    """Open an input file and yield an iterator over its bot output lines.
+
+    Compressed inputs are decompressed as they're read, so nothing is
+    unpacked to disk and memory stays bounded.
+    """
+    with open_text(input_file) as f:
+        if _is_json(f):
+            yield iter_discord_export_lines(f)
+        else:
+            yield f
@@ -0,0 +1,106 @@
+"""
+Tail reading - finds the last few attempts by scanning the input backwards
+from the end, so latency doesn't grow as nights pile up in one file.
+"""
+
+import re
+from typing import List, Any, Iterator, Tuple
+
+from bosses import detect_boss_from_lines, unknown_boss_error
+from .attempts import clean_line, iter_segments, build_attempt
+
+BLOCK_SIZE = 64 * 1024
+
+
+def iter_lines_reversed(f, block_size: int = BLOCK_SIZE) -> Iterator[Tuple[int, str]]:
+    """Yield (byte offset, line) pairs from a binary file, last line first."""
+    f.seek(0, 2)
+    position = f.tell()
+    partial = b""
+    while position > 0:
+        size = min(block_size, position)
+        position -= size
+        f.seek(position)
+        raw_lines = (f.read(size) + partial).split(b"\n")
+        # The first piece may continue in the previous block
+        partial = raw_lines.pop(0)
+        offset = position + len(partial) + 1
+        starts = []
+        for raw in raw_lines:
+            starts.append(offset)
+            offset += len(raw) + 1
+        for start, raw in zip(reversed(starts), reversed(raw_lines)):
+            yield from _decoded(start, raw)
+    yield from _decoded(0, partial)
+
+
+def _decoded(offset: int, raw: bytes) -> Iterator[Tuple[int, str]]:
+    """Decode one raw line, last piece first if it has lone carriage returns."""
+    line = raw.decode('utf-8')
+    if '\r' in line.rstrip('\r'):
+        # Lone carriage returns end a line in open(..., 'r') too
+        for piece in reversed(line.replace('\r\n', '\n').replace('\r', '\n').split('\n')):
+            yield offset, piece
+    else:
+        yield offset, line
+
+
+def detect_tail_boss(input_file: str):
+    """The boss named closest to the end of the file."""
+    with open(input_file, 'rb') as f:
+        for _, line in iter_lines_reversed(f):
+            try:
+                return detect_boss_from_lines([line])
+            except ValueError:
+                continue
+    raise unknown_boss_error()
+
+
+def read_last_attempts(input_file: str, boss, count: int) -> List[Any]:
+    """The last count non-empty attempts in file order, read from the end.
+
+    Reads back until it has one more header than it needs: the earliest
+    segment may be a duplicate header that the serial pass would have
+    merged into the attempt before it, so it is parsed but thrown away.
+    Every later segment comes out exactly as parse_attempts() sees it.
+    """
+    if count <= 0:
+        return []
+
+    collected = []  # (offset, line), newest first
+    headers = 0
+    wanted = count + 1
+    with open(input_file, 'rb') as f:
+        for offset, line in iter_lines_reversed(f):
+            collected.append((offset, line))
+            if '#' not in line:
+                continue
+            cleaned_line = clean_line(line)
+            if not (boss.is_attempt_header(cleaned_line) and re.search(r'#(\d+)', cleaned_line)):
+                continue
+            headers += 1
+            if headers < wanted:
+                continue
+
+            attempts = _complete_attempts(collected, boss, skip_first=True)
+            if len(attempts) >= count:
+                return attempts[-count:]
+            # Some were empty or duplicates - keep reading back
+            wanted *= 2
+
+    # Reached the start of the file, so nothing is partial
+    return _complete_attempts(collected, boss, skip_first=False)[-count:]
+
+
+def _complete_attempts(collected: List[Tuple[int, str]], boss, skip_first: bool) -> List[Any]:
+    """Parse the collected tail forwards into non-empty attempts."""
+    segments = list(iter_segments(reversed(collected), boss))
+    if skip_first:
+        segments = segments[1:]
+    attempts = []
+    for segment in segments:
+        attempt = build_attempt(segment, boss)
+        # Filter out empty attempts (sometimes from other bosses)
+        if attempt and attempt.events:
+            attempts.append(attempt)
+    return attempts
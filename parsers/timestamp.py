@@ -12,6 +12,7 @@ def is_timestamp(line: str) -> bool:
     return bool(
         re.match(r'\[\d{2}:\d{2}:\d{2}(\.\d{3})?\]', line.strip()) or
         re.match(r'\d{1,2}/\d{1,2}/\d{4}(\s+at)?\s+\d{1,2}:\d{2}\s*[AP]M', line.strip()) or
+        re.match(r'\d{4}-\d{2}-\d{2}[ T]\d{2}:\d{2}(:\d{2}(\.\d+)?)?$', line.strip()) or
         re.match(r'Today at \d{1,2}:\d{2}\s*[AP]M', line.strip())
     )
 
@@ -47,6 +48,14 @@ def parse_timestamp(line: str) -> datetime:
         except ValueError:
             pass  # Try next format
     
+    # Try YYYY-MM-DD HH:MM:SS format (exact times from Discord exports)
+    match = re.match(r'\d{4}-\d{2}-\d{2}[ T]\d{2}:\d{2}(:\d{2}(\.\d+)?)?$', line.strip())
+    if match:
+        try:
+            return datetime.fromisoformat(match.group(0))
+        except ValueError:
+            pass  # Try next format
+    
     # Try "Today at H:MM AM/PM" format
     match = re.match(r'Today at (\d{1,2}):(\d{2})\s*([AP]M)', line.strip())
     if match:
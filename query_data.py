@@ -0,0 +1,115 @@
+"""
+Query parsed raid history - builds a persistent index from cleaned nights
+and answers player/boss/cause/pull/date questions without reparsing.
+"""
+
+import argparse
+import sys
+from collections import Counter
+from typing import List, Optional
+
+from bosses import detect_boss_from_lines
+from parsers.arguments import parse_pull_range, parse_date
+from parsers.attempts import parse_attempts
+from parsers.source import open_lines
+from indexes.history import HistoryIndex
+
+DEFAULT_INDEX = "raid_index.json"
+
+
+def build_index(index_file: str, input_files: List[str]) -> None:
+    """Parse each night and fold it into the index."""
+    try:
+        index = HistoryIndex.load(index_file)
+    except FileNotFoundError:
+        index = HistoryIndex()
+
+    for input_file in input_files:
+        try:
+            if index.is_current(input_file):
+                print(f"Skipping {input_file} (already indexed)")
+                continue
+            with open_lines(input_file) as lines:
+                boss = detect_boss_from_lines(lines)
+        except FileNotFoundError:
+            print(f"Error: Could not find {input_file}")
+            continue
+        except Exception as e:
+            print(f"Error reading {input_file}: {e}")
+            continue
+
+        # Parse in a second streaming pass so big exports never sit in memory
+        try:
+            with open_lines(input_file) as lines:
+                attempts = parse_attempts(lines, boss)
+        except Exception as e:
+            print(f"Error parsing {input_file}: {e}")
+            continue
+        index.add_night(input_file, attempts)
+        print(f"Indexed {len(attempts)} {boss.name} attempts from {input_file}")
+
+    index.save(index_file)
+    print(f"Index saved to {index_file} ({len(index.nights)} nights, {len(index.events)} events)")
+
+
+def format_results(results: List[dict]) -> str:
+    """Format query results with per-player totals."""
+    if not results:
+        return "No matching events found."
+
+    output = []
+    for row in results:
+        when = row['when'][:16].replace('T', ' ') if row['when'] else "unknown time"
+        output.append(f"{when}  {row['boss']} #{row['pull']}  {row['player']}: {row['cause']}")
+
+    output.append("")
+    output.append(f"Matching events: {len(results)}")
+    totals = Counter(row['player'] for row in results)
+    for player, count in totals.most_common():
+        output.append(f"  {player}: {count} times")
+    return "\n".join(output)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Query indexed raid history.")
+    parser.add_argument("--index", default=DEFAULT_INDEX, help=f"index file (default: {DEFAULT_INDEX})")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    build = commands.add_parser("build", help="parse nights and add them to the index")
+    build.add_argument("inputs", nargs="+", help="raw Discord bot output files, one per night")
+
+    query = commands.add_parser("query", help="search the index")
+    query.add_argument("--player", help="player name")
+    query.add_argument("--boss", help="boss name (substring)")
+    query.add_argument("--cause", help="death/mistake cause (substring)")
+    query.add_argument("--pulls", type=parse_pull_range, help="pull range, e.g. 10-20")
+    query.add_argument("--since", type=parse_date, help="first date, YYYY-MM-DD")
+    query.add_argument("--until", type=lambda value: parse_date(value, end=True), help="last date, YYYY-MM-DD")
+
+    args = parser.parse_args(argv)
+
+    if args.command == "build":
+        build_index(args.index, args.inputs)
+        return 0
+
+    try:
+        index = HistoryIndex.load(args.index)
+    except FileNotFoundError:
+        print(f"Error: Could not find {args.index}")
+        print("Build it first with: python query_data.py build data.txt")
+        return 1
+
+    results = index.query(
+        player=args.player,
+        boss=args.boss,
+        cause=args.cause,
+        pulls=args.pulls,
+        since=args.since,
+        until=args.until,
+    )
+    print(format_results(results))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
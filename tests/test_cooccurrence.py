@@ -0,0 +1,80 @@
+"""
+CooccurrenceMatrix must only report pairs seen together more often than
+chance, and give the same pairs with SciPy, with just NumPy, and in pure
+Python.
+"""
+
+import random
+
+import pytest
+
+import analyzers.cooccurrence as cooccurrence
+from bosses.archived.gallywix import Gallywix
+from parsers.attempts import Attempt
+
+PLAYERS = ["Alpha", "Bravo", "Charlie", "Delta", "Echo", "Foxtrot"]
+EVENTS = [
+    "  {p} died to Giga Blast (0:30)",
+    "  {p} was hit by Giga Blast Residue (0:40)",
+    "  {p} died to Overloaded Rockets (1:10)",
+    "  {p} died with Cuff Bomb (1:20)",
+    "  DPS Canister #{n} was soaked by fewer than 4 players (0:50)",
+]
+
+
+def make_attempts(count=300, seed=3):
+    rng = random.Random(seed)
+    boss = Gallywix()
+    attempts = []
+    for i in range(count):
+        events = [
+            rng.choice(EVENTS).format(p=rng.choice(PLAYERS), n=rng.randint(1, 4))
+            for _ in range(rng.randint(0, 5))
+        ]
+        # Alpha and Bravo tend to go down together
+        if rng.random() < 0.2:
+            events += ["  Alpha died to Giga Blast (2:00)", "  Bravo died to Giga Blast (2:01)"]
+        attempts.append(Attempt(f"Gallywix #{i + 1}   (3:00)", events, "3/4/2025 8:00 PM", boss))
+    return attempts
+
+
+def all_pairs(matrix, by):
+    return {
+        'mistakes': matrix.mistake_pairs(top=1000, min_count=1, by=by),
+        'players': matrix.player_pairs(top=1000, min_count=1, by=by),
+    }
+
+
+@pytest.mark.parametrize("by", ["lift", "count"])
+def test_paths_agree_and_keep_only_lift_above_one(monkeypatch, by):
+    matrix = cooccurrence.CooccurrenceMatrix(make_attempts())
+    results = [all_pairs(matrix, by)]
+    monkeypatch.setattr(cooccurrence, 'sparse', None)
+    results.append(all_pairs(matrix, by))
+    monkeypatch.setattr(cooccurrence, 'np', None)
+    results.append(all_pairs(matrix, by))
+
+    key = lambda pairs: [(pair['first'], pair['second'], pair['count']) for pair in pairs]
+    for table in ('mistakes', 'players'):
+        assert results[0][table]
+        assert all(pair['lift'] > 1 for pair in results[0][table])
+        for other in results[1:]:
+            assert key(other[table]) == key(results[0][table])
+
+
+@pytest.mark.parametrize("path", ["scipy", "numpy", "python"])
+def test_below_chance_pairs_are_left_out(monkeypatch, path):
+    if path != "scipy":
+        monkeypatch.setattr(cooccurrence, 'sparse', None)
+    if path == "python":
+        monkeypatch.setattr(cooccurrence, 'np', None)
+    boss = Gallywix()
+    # Alpha dies in 8 of 10 pulls and Bravo in 5, but together in only 3:
+    # lift 3 * 10 / (8 * 5) = 0.75
+    dead = [{"Alpha"}] * 5 + [{"Alpha", "Bravo"}] * 3 + [{"Bravo"}] * 2
+    attempts = [
+        Attempt(f"Gallywix #{i + 1}   (3:00)", [f"  {player} died to Giga Blast (0:30)" for player in sorted(players)],
+                "3/4/2025 8:00 PM", boss)
+        for i, players in enumerate(dead)
+    ]
+    assert cooccurrence.CooccurrenceMatrix(attempts).player_pairs(min_count=1) == []
@@ -0,0 +1,80 @@
+"""
+Regression test: parse_attempts_parallel() must give exactly what the
+serial parse_attempts() + analyze_player_stats() gives, whatever the line
+endings and wherever the chunk boundaries fall.
+"""
+
+import random
+
+import pytest
+
+import parsers.parallel as parallel
+from analyzers.player_stats import analyze_player_stats
+from bosses.archived.gallywix import Gallywix
+from parsers.attempts import parse_attempts
+
+PLAYERS = ["Alpha", "Bravo", "Charlie", "Delta", "Echo", "Foxtrot"]
+EVENTS = [
+    "{p} died to Giga Blast ({t})",
+    "{p} was hit by Giga Blast Residue ({t})",
+    "{p} died to Overloaded Rockets ({t})",
+    "DPS Canister #{n} was soaked by fewer than 4 players ({t})",
+    "{p} died with Cuff Bomb ({t})",
+]
+
+
+def generate_lines(nights=3, seed=1):
+    """Bot output with split "Part N" pulls, resent headers and bot warnings."""
+    rng = random.Random(seed)
+    lines = []
+    for night in range(nights):
+        for pull in range(1, rng.randint(8, 15) + 1):
+            duration = rng.randint(30, 400)
+            parts = 2 if rng.random() < 0.2 else 1
+            for part in range(parts):
+                suffix = f" - Part {part + 1}" if parts > 1 else ""
+                header = f"Gallywix #{pull}{suffix}   ({duration // 60}:{duration % 60:02d})"
+                lines.append(header)
+                if rng.random() < 0.1:
+                    lines.append(header)  # the bot sometimes sends a header twice
+                if rng.random() < 0.1:
+                    lines.append(":warning: Experimental :warning:")
+                for _ in range(rng.randint(0, 5)):
+                    second = rng.randint(0, duration)
+                    lines.append(rng.choice(EVENTS).format(
+                        p=rng.choice(PLAYERS), t=f"{second // 60}:{second % 60:02d}", n=rng.randint(1, 4)))
+                minute = 2 + pull * 3 + part
+                lines.append(f"3/{4 + 7 * night}/2025 {8 + minute // 60}:{minute % 60:02d} PM")
+                lines.append("")
+    return lines
+
+
+def line_endings(lines, style):
+    if style == 'mixed':
+        endings = ["\n", "\r\n", "\r"]
+        return "".join(line + endings[i % 3] for i, line in enumerate(lines))
+    return "".join(line + style for line in lines)
+
+
+def summary(attempts, stats):
+    return (
+        [(attempt.header, attempt.events, attempt.timestamp) for attempt in attempts],
+        [(player, list(causes.items())) for player, causes in stats.items()],
+    )
+
+
+@pytest.mark.parametrize("style", ["\n", "\r\n", "\r", "mixed"], ids=["lf", "crlf", "cr", "mixed"])
+@pytest.mark.parametrize("chunks_per_worker", [1, 2, 50, 1000])
+def test_parallel_matches_serial(tmp_path, monkeypatch, style, chunks_per_worker):
+    boss = Gallywix()
+    input_file = tmp_path / "data.txt"
+    input_file.write_bytes(line_endings(generate_lines(), style).encode('utf-8'))
+
+    with open(input_file, 'r', encoding='utf-8') as f:
+        attempts = parse_attempts(f, boss)
+    expected = summary(attempts, analyze_player_stats(attempts))
+    assert expected[0]
+
+    monkeypatch.setattr(parallel, 'CHUNKS_PER_WORKER', chunks_per_worker)
+    for workers in (1, 3):
+        assert summary(*parallel.parse_attempts_parallel(str(input_file), boss, workers)) == expected